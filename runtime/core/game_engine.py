@@ -12,7 +12,8 @@ Architecture:
 """
 
 import json
-from typing import Dict, List, Any, Optional
+import traceback
+from typing import Dict, List, Any, Optional, Iterable, Tuple, TYPE_CHECKING
 from pathlib import Path
 
 from .memory import Memory
@@ -21,7 +22,9 @@ from .transitioner import Transitioner, TransitionError
 from .interfaces.node_manager_interface import INodeManager
 from .saver import Saver, SaveData
 from .key_handler import KeyHandler
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
 
 
 class ReturnToMenuException(Exception):
@@ -41,7 +44,9 @@ class GameEngine:
         self.memory = Memory()
         self.register = Register()
         self.key_handler = KeyHandler()
-        self.gui = GUI(key_handler=self.key_handler, scroll_callback=self._handle_scroll_back, engine=self)
+        # Import à la construction: importer le moteur ne charge pas PyQt6
+        from ..ui.gui import GUI
+        self.gui: 'GUI' = GUI(key_handler=self.key_handler, scroll_callback=self._handle_scroll_back, engine=self)
         self.saver = Saver(save_directory)
         self.transitioner: Optional[Transitioner] = None
 
@@ -55,6 +60,7 @@ class GameEngine:
         self.memory_snapshots: List[Dict[str, Any]] = []  # Snapshot de la mémoire à chaque node
         self.can_go_back: bool = False
         self._go_back_requested: bool = False  # Flag pour demander un retour en arrière
+        self._return_to_menu_requested: bool = False  # Flag pour demander un retour au menu
 
     # ==================== Enregistrement des managers ====================
 
@@ -79,6 +85,23 @@ class GameEngine:
         for node_type in node_types:
             self.register.register_manager(node_type, manager)
 
+    def register_managers_bulk(self, pairs: Iterable[Tuple[str, INodeManager]]) -> int:
+        """
+        Enregistre plusieurs managers en une seule passe.
+
+        Args:
+            pairs: Paires (type de node, instance du NodeManager)
+
+        Returns:
+            Nombre d'associations enregistrées
+        """
+        register_manager = self.register.register_manager
+        count = 0
+        for node_type, manager in pairs:
+            register_manager(node_type, manager)
+            count += 1
+        return count
+
     def initialize_managers(self) -> None:
         """Initialise tous les managers enregistrés et le GUI."""
         # Initialiser le GUI
@@ -115,6 +138,9 @@ class GameEngine:
         # Charger les nodes
         self.nodes = self.template.get('nodes', {})
 
+        # Valider puis précompiler les nodes pour leurs managers
+        self._finalize_template()
+
         # Charger les connexions et créer le Transitioner
         connections = self.template.get('connections', [])
         self.transitioner = Transitioner(connections)
@@ -150,6 +176,38 @@ class GameEngine:
                         abs_path = (project_dir / path).resolve()
                         data[field] = str(abs_path)
 
+    def _finalize_template(self) -> None:
+        """
+        Valide puis précompile chaque node via les managers enregistrés pour son type.
+
+        La validation n'a lieu qu'ici, une seule fois par node. Tous les nodes sont
+        validés avant d'abandonner, pour signaler toutes les erreurs en une fois.
+        Les managers stockent ensuite leurs données typées sous
+        node['_compiled'][manager.id], ce qui évite de relire node['data'] à chaque exécution.
+
+        Raises:
+            ValueError: Si des managers rejettent des nodes (liste de tous les rejets)
+        """
+        errors: List[str] = []
+        for node_id, node in self.nodes.items():
+            node_type = node.get('type')
+            for manager in self.register.get_managers(node_type):
+                try:
+                    valid = manager.validate_node(node)
+                except Exception as e:
+                    errors.append(f"node '{node_id}' ({node_type}), manager '{manager.id}': {e}")
+                    continue
+                if not valid:
+                    errors.append(f"node '{node_id}' ({node_type}), manager '{manager.id}': node invalide")
+
+        if errors:
+            details = "\n".join(f"  - {error}" for error in errors)
+            raise ValueError(f"{len(errors)} node(s) invalide(s) dans la template:\n{details}")
+
+        for node in self.nodes.values():
+            for manager in self.register.get_managers(node.get('type')):
+                manager.compile_node(node)
+
     # ==================== Exécution ====================
 
     def process_node(self, node_id: str) -> Dict[str, Any]:
@@ -239,6 +297,8 @@ class GameEngine:
                 self.history.clear()
                 self.memory_snapshots.clear()
                 self.can_go_back = False
+                self._go_back_requested = False
+                self._return_to_menu_requested = False
 
                 # Cacher tous les composants GUI (musique, background, etc.)
                 self.gui.hide_all_components()
@@ -266,7 +326,6 @@ class GameEngine:
             print("\n\n⏸️  Jeu interrompu")
         except Exception as e:
             print(f"\n❌ Erreur: {e}")
-            import traceback
             traceback.print_exc()
         finally:
             print("\n" + "=" * 50)
@@ -277,15 +336,16 @@ class GameEngine:
             self.cleanup_managers()
 
     def _game_loop(self) -> None:
-        """Boucle principale du jeu (traitement des nodes)."""
-        import time
+        """
+        Boucle principale du jeu (traitement des nodes).
+
+        Les nodes s'enchaînent sans attente: la boucle d'événements Qt n'est servie
+        que pendant les attentes d'interaction des composants (texte, choix, menus),
+        qui sont aussi les seuls moments où un scroll peut survenir.
+        """
         current = self.current_node
 
         while current:
-            # Process events pour permettre au scroll d'être détecté
-            self.gui.process_events()
-            time.sleep(0.01)
-
             # Vérifier si un retour en arrière est demandé
             if self._go_back_requested:
                 self._go_back_requested = False
@@ -302,9 +362,18 @@ class GameEngine:
             self.memory_snapshots.append(self.memory.get_all().copy())
             self.can_go_back = len(self.history) > 0
 
+            # Préparer les assets des nodes suivants pendant l'attente du joueur
+            self._prefetch_successors(current)
+
             # Traiter le node via ses managers
             result = self.process_node(current)
 
+            # Retour au menu demandé pendant l'interaction (menu pause):
+            # levé ici, hors des slots Qt, pour remonter jusqu'à run()
+            if self._return_to_menu_requested:
+                self._return_to_menu_requested = False
+                raise ReturnToMenuException()
+
             # Valider et transitionner
             try:
                 next_node = self.transitioner.transition(self.nodes[current], result)
@@ -313,14 +382,45 @@ class GameEngine:
                 print(f"\n❌ Erreur de transition: {e}")
                 break
 
+    def _prefetch_successors(self, node_id: str) -> None:
+        """
+        Demande aux managers de préparer les assets des nodes atteignables depuis un node.
+
+        Toutes les branches sont préparées: pendant un choix, le joueur n'a pas encore décidé.
+
+        Args:
+            node_id: ID du node sur le point d'être traité
+        """
+        for conn in self.transitioner.get_connections_from(node_id):
+            node = self.nodes.get(conn['to_node'])
+            if node is None:
+                continue
+            for manager in self.register.get_managers(node.get('type')):
+                manager.prefetch(node, self.gui)
+
     def _handle_scroll_back(self) -> None:
         """Callback appelé quand l'utilisateur scroll vers le haut."""
         if self.can_go_back:
             self._go_back_requested = True
+            # Réveiller le composant en attente d'interaction
+            self.gui.interrupt_waits()
+
+    @property
+    def interaction_interrupted(self) -> bool:
+        """True si un retour en arrière ou au menu doit terminer l'interaction en cours."""
+        return self._go_back_requested or self._return_to_menu_requested
 
     def return_to_menu(self) -> None:
-        """Lève une exception pour retourner au menu principal."""
-        raise ReturnToMenuException()
+        """
+        Demande le retour au menu principal.
+
+        Appelé depuis un slot Qt (menu pause): une exception levée ici n'atteindrait
+        pas run(). L'attente en cours est terminée et la boucle de jeu lève
+        ReturnToMenuException après le node courant.
+        """
+        self._return_to_menu_requested = True
+        # Réveiller le composant en attente d'interaction
+        self.gui.interrupt_waits()
 
     # ==================== Utilitaires ====================
 
@@ -410,7 +510,7 @@ class GameEngine:
         if music_component and hasattr(music_component, 'get_tracks'):
             tracks = music_component.get_tracks()
             if tracks:
-                custom_data['music_tracks'] = tracks
+                custom_data['music_tracks'] = dict(tracks)
 
         return self.saver.save(
             slot=slot,
@@ -21,6 +21,9 @@ class INodeManager(ABC):
     - Définir final_next pour indiquer le port de sortie
     """
 
+    # Pas de __dict__ ici: les sous-classes peuvent déclarer leurs propres __slots__
+    __slots__ = ()
+
     @property
     @abstractmethod
     def id(self) -> str:
@@ -49,6 +52,55 @@ class INodeManager(ABC):
 
         Le node peut être modifié directement ou retourner un dict de modifications.
         Le Transitioner vérifiera que 'final_next' est défini avant de continuer.
+        Le résultat peut être une constante partagée en lecture seule (MappingProxyType):
+        l'appelant ne doit pas le muter.
+        """
+        pass
+
+    def compile_node(self, node: Dict[str, Any]) -> Any:
+        """
+        Précompilation d'un node (optionnel).
+        Appelé une fois par node au chargement de la template.
+
+        Permet de lire et typer les champs de node['data'] une seule fois,
+        en stockant le résultat sous node['_compiled'][self.id] pour process().
+        Chaque manager a sa propre entrée: plusieurs managers peuvent traiter
+        le même type de node. L'entrée existe dès le chargement: process() et
+        prefetch() la lisent directement (managers enregistrés avant load_template).
+
+        Args:
+            node: Données complètes du node
+
+        Returns:
+            Les données précompilées, ou None si le manager n'en a pas besoin
+        """
+        return None
+
+    def validate_node(self, node: Dict[str, Any]) -> bool:
+        """
+        Validation d'un node (optionnel).
+        Appelé une fois par node au chargement de la template, avant compile_node().
+
+        Peut compléter node['data'] avec les valeurs par défaut,
+        process() peut alors supposer un node bien formé.
+
+        Args:
+            node: Données complètes du node
+
+        Returns:
+            True si le node est valide
+        """
+        return True
+
+    def prefetch(self, node: Dict[str, Any], gui: 'GUI' = None) -> None:
+        """
+        Préparation anticipée des assets d'un node (optionnel).
+        Appelé quand le node peut être le prochain exécuté, pendant que
+        le joueur lit le texte ou réfléchit à un choix.
+
+        Args:
+            node: Données complètes du node (déjà précompilé)
+            gui: Accès au moteur GUI (optionnel)
         """
         pass
 
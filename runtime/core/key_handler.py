@@ -2,10 +2,16 @@
 KeyHandler - Gestionnaire de touches clavier pour le runtime
 
 Permet d'enregistrer des callbacks associés à des touches et de les déclencher.
+Chaque touche est liée à un QShortcut: Qt résout le raccourci en C++,
+sans filtre d'événements Python appelé à chaque frappe ou mouvement de souris.
 """
 
-from typing import Callable, Dict, Optional, Any
-from PyQt6.QtCore import Qt
+from typing import Callable, Dict, Optional, Any, TYPE_CHECKING
+
+# PyQt6 n'est importé qu'à la création des raccourcis: le moteur reste importable sans Qt
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QShortcut
+    from PyQt6.QtWidgets import QWidget
 
 
 class KeyHandler:
@@ -18,6 +24,49 @@ class KeyHandler:
 
     def __init__(self):
         self._key_bindings: Dict[int, Callable] = {}
+        # Raccourcis Qt créés une fois la fenêtre attachée
+        self._shortcuts: Dict[int, 'QShortcut'] = {}
+        self._window: Optional['QWidget'] = None
+
+    # ==================== Raccourcis Qt ====================
+
+    def attach(self, window: 'QWidget') -> None:
+        """
+        Attache le handler à la fenêtre et crée les raccourcis de toutes les touches.
+
+        Args:
+            window: Fenêtre principale du jeu
+        """
+        self.detach()
+        self._window = window
+        for key in self._key_bindings:
+            self._bind(key)
+
+    def detach(self) -> None:
+        """Supprime tous les raccourcis Qt (les callbacks restent enregistrés)."""
+        for key in list(self._shortcuts):
+            self._unbind(key)
+        self._window = None
+
+    def _bind(self, key: int) -> None:
+        """Crée le QShortcut d'une touche sur la fenêtre attachée."""
+        from PyQt6.QtCore import Qt
+        from PyQt6.QtGui import QKeySequence, QShortcut
+        self._unbind(key)
+        shortcut = QShortcut(QKeySequence(key), self._window)
+        # Actif même quand un widget enfant a le focus
+        shortcut.setContext(Qt.ShortcutContext.ApplicationShortcut)
+        shortcut.activated.connect(self._key_bindings[key])
+        self._shortcuts[key] = shortcut
+
+    def _unbind(self, key: int) -> None:
+        """Supprime le QShortcut d'une touche s'il existe."""
+        shortcut = self._shortcuts.pop(key, None)
+        if shortcut is not None:
+            shortcut.setEnabled(False)
+            shortcut.deleteLater()
+
+    # ==================== Enregistrement des touches ====================
 
     def register_key(self, key: int, callback: Callable[[], Any]) -> None:
         """
@@ -28,6 +77,8 @@ class KeyHandler:
             callback: Fonction à appeler quand la touche est pressée
         """
         self._key_bindings[key] = callback
+        if self._window is not None:
+            self._bind(key)
         print(f"✓ Touche {self._key_name(key)} enregistrée")
 
     def unregister_key(self, key: int) -> None:
@@ -39,11 +90,12 @@ class KeyHandler:
         """
         if key in self._key_bindings:
             del self._key_bindings[key]
+            self._unbind(key)
             print(f"✓ Touche {self._key_name(key)} désenregistrée")
 
     def handle_key_press(self, key: int) -> bool:
         """
-        Traite l'appui d'une touche.
+        Traite l'appui d'une touche (déclenchement programmatique).
 
         Args:
             key: Code Qt de la touche pressée
@@ -72,6 +124,8 @@ class KeyHandler:
     def clear_all(self) -> None:
         """Désenregistre toutes les touches."""
         self._key_bindings.clear()
+        for key in list(self._shortcuts):
+            self._unbind(key)
         print("✓ Toutes les touches désenregistrées")
 
     def get_registered_keys(self) -> list:
@@ -85,6 +139,7 @@ class KeyHandler:
 
     def _key_name(self, key: int) -> str:
         """Retourne le nom de la touche pour debug."""
+        from PyQt6.QtCore import Qt
         key_names = {
             Qt.Key.Key_Escape: "ESC",
             Qt.Key.Key_Space: "SPACE",
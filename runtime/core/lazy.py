@@ -0,0 +1,44 @@
+"""
+Lazy - Exports paresseux des packages du runtime (PEP 562)
+
+Un package déclare {nom exporté: sous-module} et ne charge le sous-module
+(et ses dépendances, Qt notamment) qu'au premier accès au nom.
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, namespace: Dict[str, Any], exports: Dict[str, str]
+                 ) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Construit le __getattr__ et le __dir__ d'un package à exports paresseux.
+
+    Args:
+        package: Nom du package (__name__)
+        namespace: Espace de noms du package (globals()), où les objets importés sont mis en cache
+        exports: Nom exporté → sous-module relatif qui le définit
+
+    Returns:
+        (__getattr__, __dir__) à affecter au niveau du package
+    """
+    def __getattr__(name: str) -> Any:
+        """
+        Importe l'objet demandé à la volée et le met en cache dans le package.
+
+        Raises:
+            AttributeError: Si le nom n'est pas exporté par le package
+        """
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+        obj = getattr(importlib.import_module(f'.{module_name}', package), name)
+        namespace[name] = obj
+        return obj
+
+    def __dir__() -> List[str]:
+        """Expose aussi les objets pas encore importés (chaque nom une seule fois)."""
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -42,6 +42,15 @@ class Memory:
         """
         self._store[key] = value
 
+    def update(self, mapping: Dict[str, Any]) -> None:
+        """
+        Définit plusieurs valeurs en une seule opération.
+
+        Args:
+            mapping: Dict {clé: valeur} à fusionner
+        """
+        self._store.update(mapping)
+
     def has(self, key: str) -> bool:
         """
         Vérifie si une clé existe.
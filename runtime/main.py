@@ -4,47 +4,67 @@ Runtime Main - Lance le moteur de jeu avec architecture NodeManager
 Usage:
     python runtime/main.py <template.json>
     python runtime/main.py templates/jeu.json
+    python -m runtime.main templates/jeu.json
+    choice-game templates/jeu.json   (après `pip install -e .`)
 """
 
 import sys
 import argparse
+import logging
+import traceback
 from pathlib import Path
-
-# Ajouter le dossier parent au path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from runtime.core.game_engine import GameEngine
-from runtime.core.manager_loader import ManagerLoader
-from runtime.managers import (
-    TextDisplayManager,
-    ChoiceInputManager,
-    VariableSetterManager,
-    ConditionEvaluatorManager,
-    ImageManager,
-    MassInitManager,
-    MusicManager
-)
-from runtime.ui.components import (
-    TextDialogComponent,
-    ChoiceDialogComponent,
-    ImageComponent,
-    GameMenuComponent,
-    PauseMenuComponent,
-    MusicComponent,
-    CharacterPortraitComponent
+from typing import TYPE_CHECKING
+
+# Lancé comme script (python runtime/main.py): rendre le package 'runtime' importable.
+# Inutile via `python -m runtime.main` ou le script installé `choice-game`.
+if not __package__:
+    sys.path.insert(0, str(Path(__file__).parent.parent))
+
+if TYPE_CHECKING:
+    from runtime.core.game_engine import GameEngine
+
+# NodeManagers intégrés: (type de node, nom de la classe dans runtime.managers)
+# Les classes sont résolues à la demande (import paresseux de runtime.managers)
+_MANAGERS = (
+    ('text.text', 'TextDisplayManager'),
+    ('choice.choice', 'ChoiceInputManager'),
+    ('variables.variable', 'VariableSetterManager'),
+    ('variables.condition', 'ConditionEvaluatorManager'),
+    ('image.image', 'ImageManager'),
+    ('massinit.massinit', 'MassInitManager'),
+    ('music.music', 'MusicManager'),
 )
-from PyQt6.QtCore import Qt
 
 
-def setup_input_events(engine: GameEngine) -> None:
+def _report_exception(exc: BaseException) -> None:
+    """
+    Écrit la trace complète d'une exception sur stderr en une seule écriture.
+
+    Args:
+        exc: Exception à afficher
+    """
+    sys.stderr.write(''.join(traceback.TracebackException.from_exception(exc).format()))
+
+
+def _excepthook(exc_type, exc, tb) -> None:
+    """Hook global: aussi utilisé par PyQt6 pour les exceptions levées dans les slots Qt."""
+    _report_exception(exc)
+
+
+def setup_input_events(engine: 'GameEngine') -> None:
     """
     Configure tous les événements clavier et souris du jeu.
 
     Args:
         engine: Instance du GameEngine
     """
+    from PyQt6.QtCore import Qt
+
     def open_pause_menu():
         """Ouvre le menu pause et gère les actions."""
+        # Déjà ouvert (ESC hors du menu): ne pas empiler un second menu
+        if engine.gui.is_component_visible('pause_menu'):
+            return
         action = engine.gui.show_component('pause_menu')
         if action == 'save':
             success = engine.save_game(slot=1)
@@ -73,9 +93,18 @@ def main():
     parser = argparse.ArgumentParser(description='Moteur de jeu à choix')
     parser.add_argument('template', type=str, nargs='?', help='Chemin vers le fichier template (.json)')
     parser.add_argument('--start', type=str, help='ID du nœud de départ (optionnel)', default=None)
+    parser.add_argument('--verbose', '-v', action='store_true', help='Affiche le détail des enregistrements')
 
     args = parser.parse_args()
 
+    sys.excepthook = _excepthook
+
+    # Les avertissements des managers passent par logging (détails avec --verbose)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format='%(levelname)s [%(name)s] %(message)s'
+    )
+
     # Si aucun fichier n'est fourni, ouvrir une boîte de dialogue
     if not args.template:
         from PyQt6.QtWidgets import QApplication, QFileDialog
@@ -106,6 +135,20 @@ def main():
         print(f"Erreur: Template '{template_path}' introuvable")
         sys.exit(1)
 
+    # Imports lourds (PyQt6, managers, composants) seulement une fois la template validée
+    from runtime.core.game_engine import GameEngine
+    from runtime.core.manager_loader import ManagerLoader
+    import runtime.managers
+    from runtime.ui.components import (
+        TextDialogComponent,
+        ChoiceDialogComponent,
+        ImageComponent,
+        GameMenuComponent,
+        PauseMenuComponent,
+        MusicComponent,
+        CharacterPortraitComponent
+    )
+
     # Créer le moteur
     engine = GameEngine()
 
@@ -118,13 +161,16 @@ def main():
     engine.gui.register_component_type('pause_menu', PauseMenuComponent)
     engine.gui.register_component_type('music', MusicComponent)
     engine.gui.register_component_type('character_portrait', CharacterPortraitComponent)
-    print("  ✓ text_dialog")
-    print("  ✓ choice_dialog")
-    print("  ✓ image (avec layers)")
-    print("  ✓ game_menu")
-    print("  ✓ pause_menu")
-    print("  ✓ music")
-    print("  ✓ character_portrait")
+    if args.verbose:
+        print("\n".join((
+            "  ✓ text_dialog",
+            "  ✓ choice_dialog",
+            "  ✓ image (avec layers)",
+            "  ✓ game_menu",
+            "  ✓ pause_menu",
+            "  ✓ music",
+            "  ✓ character_portrait",
+        )))
 
     # Configuration des événements clavier et souris
     print("\n[Runtime] Configuration des événements...")
@@ -134,41 +180,16 @@ def main():
 
     # Enregistrer les NodeManagers pour chaque type de node
     print("\n[Runtime] Enregistrement des managers...")
-
-    # Manager pour les nodes de texte
-    text_manager = TextDisplayManager()
-    engine.register_manager('text.text', text_manager)
-    print(f"  ✓ {text_manager.id} → text.text")
-
-    # Manager pour les nodes de choix
-    choice_manager = ChoiceInputManager()
-    engine.register_manager('choice.choice', choice_manager)
-    print(f"  ✓ {choice_manager.id} → choice.choice")
-
-    # Manager pour les nodes de variables
-    variable_manager = VariableSetterManager()
-    engine.register_manager('variables.variable', variable_manager)
-    print(f"  ✓ {variable_manager.id} → variables.variable")
-
-    # Manager pour les nodes de condition
-    condition_manager = ConditionEvaluatorManager()
-    engine.register_manager('variables.condition', condition_manager)
-    print(f"  ✓ {condition_manager.id} → variables.condition")
-
-    # Manager pour les nodes d'image
-    image_manager = ImageManager()
-    engine.register_manager('image.image', image_manager)
-    print(f"  ✓ {image_manager.id} → image.image")
-
-    # Manager pour les nodes de massinit
-    massinit_manager = MassInitManager()
-    engine.register_manager('massinit.massinit', massinit_manager)
-    print(f"  ✓ {massinit_manager.id} → massinit.massinit")
-
-    # Manager pour les nodes de musique
-    music_manager = MusicManager()
-    engine.register_manager('music.music', music_manager)
-    print(f"  ✓ {music_manager.id} → music.music")
+    registrations = [
+        (node_type, getattr(runtime.managers, class_name)())
+        for node_type, class_name in _MANAGERS
+    ]
+    count = engine.register_managers_bulk(registrations)
+    if args.verbose:
+        for node_type, manager in registrations:
+            print(f"  ✓ {manager.id} → {node_type}")
+    else:
+        print(f"  → {count} manager(s) enregistré(s)")
 
     # Charger les managers personnalisés depuis runtime/modules/managers
     print("\n[Runtime] Chargement des managers personnalisés...")
@@ -191,8 +212,7 @@ def main():
         engine.load_template(template_path)
     except Exception as e:
         print(f"❌ Erreur lors du chargement: {e}")
-        import traceback
-        traceback.print_exc()
+        _report_exception(e)
         sys.exit(1)
 
     # Lancer le jeu
@@ -202,8 +222,7 @@ def main():
         print("\n\n⏸️  Jeu interrompu par l'utilisateur")
     except Exception as e:
         print(f"\n❌ Erreur lors de l'exécution: {e}")
-        import traceback
-        traceback.print_exc()
+        _report_exception(e)
 
 
 if __name__ == '__main__':
@@ -2,22 +2,23 @@
 NodeManagers - Gestionnaires de nodes pour le runtime
 
 Chaque NodeManager traite un type spécifique de node.
+Les sous-modules sont importés à la demande (PEP 562), au premier accès
+à la classe correspondante.
 """
 
-from .text_manager import TextDisplayManager
-from .choice_manager import ChoiceInputManager
-from .variable_manager import VariableSetterManager
-from .condition_manager import ConditionEvaluatorManager
-from .image_manager import ImageManager
-from .massinit_manager import MassInitManager
-from .music_manager import MusicManager
+from ..core.lazy import lazy_exports
 
-__all__ = [
-    'TextDisplayManager',
-    'ChoiceInputManager',
-    'VariableSetterManager',
-    'ConditionEvaluatorManager',
-    'ImageManager',
-    'MassInitManager',
-    'MusicManager'
-]
+# Nom de classe → sous-module qui la définit
+_LAZY = {
+    'TextDisplayManager': 'text_manager',
+    'ChoiceInputManager': 'choice_manager',
+    'VariableSetterManager': 'variable_manager',
+    'ConditionEvaluatorManager': 'condition_manager',
+    'ImageManager': 'image_manager',
+    'MassInitManager': 'massinit_manager',
+    'MusicManager': 'music_manager',
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
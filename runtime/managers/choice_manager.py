@@ -2,10 +2,32 @@
 ChoiceInputManager - Gère les choix interactifs
 """
 
-from typing import Dict, Any, Optional
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+log = logging.getLogger(__name__)
+
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT = MappingProxyType({'final_next': 'output'})
+_CHOICE_OUT = tuple(
+    MappingProxyType({'final_next': f'output_{i}', 'add_to_history': True}) for i in range(32)
+)
+
+
+@dataclass(slots=True)
+class ChoiceData:
+    """Données précompilées d'un node de choix."""
+    question: str
+    choices: List[Dict[str, Any]]
 
 
 class ChoiceInputManager(INodeManager):
@@ -18,11 +40,55 @@ class ChoiceInputManager(INodeManager):
     Utilise le composant ChoiceDialogComponent pour afficher les choix dans l'interface GUI.
     """
 
+    __slots__ = ('_show', '_hide')
+
+    def __init__(self):
+        # Méthodes du GUI mises en cache par initialize() (None = mode console)
+        self._show = None
+        self._hide = None
+
     @property
     def id(self) -> str:
         return "choice_input"
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+    def compile_node(self, node: Dict[str, Any]) -> ChoiceData:
+        """
+        Précompile la question et les choix d'un node.
+
+        Args:
+            node: Node avec {'data': {'question': '...', 'choices': [...]}}
+
+        Returns:
+            ChoiceData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        compiled = ChoiceData(
+            question=data.get('question', 'Que faites-vous?'),
+            choices=data.get('choices', [])
+        )
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def initialize(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
+        """
+        Met en cache les méthodes du GUI pour éviter les lookups à chaque node.
+
+        Le GUI est stable pendant toute la durée de vie du manager.
+
+        Args:
+            memory: Accès aux variables
+            gui: Accès au moteur GUI (optionnel)
+        """
+        if gui and gui.initialized:
+            self._show = gui.show_component
+            self._hide = gui.hide_component
+
+    def cleanup(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
+        """Oublie les méthodes du GUI mises en cache."""
+        self._show = None
+        self._hide = None
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Affiche les choix et récupère l'entrée utilisateur.
 
@@ -34,43 +100,43 @@ class ChoiceInputManager(INodeManager):
         Returns:
             {'final_next': 'output_X'} où X est l'index du choix
         """
-        data = node.get('data', {})
-        question = data.get('question', 'Que faites-vous?')
-        choices = data.get('choices', [])
+        cd = node['_compiled'][self.id]
+        question = cd.question
+        choices = cd.choices
 
         if not choices:
-            print("Erreur: Aucun choix disponible")
-            return {'final_next': 'output'}
+            log.error("Aucun choix disponible")
+            return _OUT
 
         # Afficher avec le GUI si disponible
-        if gui and gui.initialized:
-            choice_idx = gui.show_component('choice_dialog', question=question, choices=choices)
+        if self._show is not None:
+            choice_idx = self._show('choice_dialog', question=question, choices=choices)
         else:
             # Fallback: affichage console
-            print("\n" + "=" * 50)
-            print(question)
-            print("=" * 50)
-
-            # Afficher les choix
-            for i, choice in enumerate(choices):
-                choice_text = choice.get('text', f'Choix {i+1}')
-                print(f"{i+1}. {choice_text}")
+            count = len(choices)
+            menu = "\n".join(
+                f"{i+1}. {choice.get('text', f'Choix {i+1}')}"
+                for i, choice in enumerate(choices)
+            )
+            bar = "=" * 50
+            print(f"\n{bar}\n{question}\n{bar}\n{menu}")
 
-            # Demander le choix
+            # Demander le choix (validation sans exception)
+            prompt = f"\nVotre choix (1-{count}): "
             while True:
-                try:
-                    choice_input = input(f"\nVotre choix (1-{len(choices)}): ")
-                    choice_idx = int(choice_input) - 1
-
-                    if 0 <= choice_idx < len(choices):
-                        break
-                    else:
-                        print(f"Veuillez entrer un nombre entre 1 et {len(choices)}")
-                except ValueError:
+                choice_input = input(prompt).strip()
+                # isdecimal() garantit que int() réussit
+                choice_idx = int(choice_input) - 1 if choice_input.isdecimal() else -1
+
+                if 0 <= choice_idx < count:
+                    break
+                if choice_input.isdecimal():
+                    print(f"Veuillez entrer un nombre entre 1 et {count}")
+                else:
                     print("Veuillez entrer un nombre valide")
-                except KeyboardInterrupt:
-                    raise
 
         # Retourner le port de sortie correspondant au choix
         # Ajouter ce node à l'historique car il attend une interaction utilisateur
+        if 0 <= choice_idx < len(_CHOICE_OUT):
+            return _CHOICE_OUT[choice_idx]
         return {'final_next': f'output_{choice_idx}', 'add_to_history': True}
@@ -2,10 +2,44 @@
 ConditionEvaluatorManager - Évalue les conditions et branche selon le résultat
 """
 
-from typing import Dict, Any, Optional
+import logging
+import operator
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+log = logging.getLogger(__name__)
+
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT_TRUE = MappingProxyType({'final_next': 'output_true'})
+_OUT_FALSE = MappingProxyType({'final_next': 'output_false'})
+
+
+# Table opérateur → fonction de comparaison (résolue à la précompilation)
+_CMP: Dict[str, Callable[[Any, Any], bool]] = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+}
+
+
+@dataclass(slots=True)
+class ConditionData:
+    """Données précompilées d'un node de condition."""
+    variable: str
+    operator: str
+    value: Any
+    cmp: Optional[Callable[[Any, Any], bool]]
 
 
 class ConditionEvaluatorManager(INodeManager):
@@ -16,11 +50,35 @@ class ConditionEvaluatorManager(INodeManager):
     Définit 'final_next' à 'output_true' ou 'output_false' selon le résultat.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return "condition_evaluator"
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+    def compile_node(self, node: Dict[str, Any]) -> ConditionData:
+        """
+        Précompile la variable, l'opérateur et la valeur d'une condition.
+
+        Args:
+            node: Node avec {'data': {'variable': '...', 'operator': '...', 'value': ...}}
+
+        Returns:
+            ConditionData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        op = data.get('operator', '==')
+        compiled = ConditionData(
+            variable=data.get('variable', 'var'),
+            operator=op,
+            value=data.get('value', 0),
+            # None si opérateur invalide
+            cmp=_CMP.get(op)
+        )
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Évalue une condition et branche selon le résultat.
 
@@ -31,25 +89,18 @@ class ConditionEvaluatorManager(INodeManager):
         Returns:
             {'final_next': 'output_true'} ou {'final_next': 'output_false'}
         """
-        data = node.get('data', {})
-        variable = data.get('variable', 'var')
-        operator = data.get('operator', '==')
-        value = data.get('value', 0)
-
-        # Évaluer la condition via Memory
-        try:
-            result = memory.compare(variable, operator, value)
-        except ValueError as e:
-            print(f"Erreur de condition: {e}")
-            result = False
+        cd = node['_compiled'][self.id]
 
-        # Debug: afficher la condition (optionnel)
-        var_value = memory.get(variable, 0)
-        # print(f"[Debug] {variable} ({var_value}) {operator} {value} = {result}")
+        # Évaluer la condition avec la fonction précompilée
+        if cd.cmp is not None:
+            result = cd.cmp(memory.get(cd.variable, 0), cd.value)
+        else:
+            log.error("Erreur de condition: opérateur invalide: %s", cd.operator)
+            result = False
 
         # Brancher selon le résultat
         # Note: Le creator sauvegarde les ports avec leurs IDs (output_true, output_false)
         if result:
-            return {'final_next': 'output_true'}  # Port true
+            return _OUT_TRUE  # Port true
         else:
-            return {'final_next': 'output_false'}  # Port false
+            return _OUT_FALSE  # Port false
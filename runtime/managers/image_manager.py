@@ -4,10 +4,29 @@ ImageManager - Affiche une image avec système de layers
 Gère l'affichage d'images via le composant image avec support multi-layers.
 """
 
-from typing import Dict, Any, Optional
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+log = logging.getLogger(__name__)
+
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT = MappingProxyType({'final_next': 'output'})
+
+
+@dataclass(slots=True)
+class ImageData:
+    """Données précompilées d'un node image."""
+    image_path: str
+    layer: int
 
 
 class ImageManager(INodeManager):
@@ -17,15 +36,42 @@ class ImageManager(INodeManager):
     Affiche une image en utilisant le composant image du GUI avec système de layers.
     """
 
+    __slots__ = ('_show', '_showing')
+
+    def __init__(self):
+        # Méthodes du GUI mises en cache par initialize()
+        self._show = None
+        self._showing = None
+
     @property
     def id(self) -> str:
         return "image_manager"
 
-    def initialize(self, memory: Memory, gui: Optional[GUI] = None) -> None:
-        """Initialisation du manager"""
-        pass
+    def compile_node(self, node: Dict[str, Any]) -> ImageData:
+        """
+        Précompile les données d'un node image.
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+        Args:
+            node: Node avec image_path et layer
+
+        Returns:
+            ImageData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        compiled = ImageData(
+            image_path=data.get('image_path', ''),
+            layer=data.get('layer', 0)
+        )
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def initialize(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
+        """Initialisation du manager: met en cache les méthodes du GUI"""
+        if gui and gui.initialized:
+            self._show = gui.show_component
+            self._showing = gui.is_component_showing
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Traite un node image.
 
@@ -37,29 +83,41 @@ class ImageManager(INodeManager):
         Returns:
             Dictionnaire avec final_next
         """
-        if not gui:
-            print("⚠️  GUI non disponible, impossible d'afficher l'image")
-            return {'final_next': 'output'}
+        show = self._show
+        if show is None:
+            log.warning("GUI non disponible, impossible d'afficher l'image")
+            return _OUT
 
-        # Récupérer le chemin de l'image et le layer
-        data = node.get('data', {})
-        image_path = data.get('image_path', '')
-        layer = data.get('layer', 0)
+        # Récupérer le chemin de l'image et le layer (précompilés)
+        cd = node['_compiled'][self.id]
 
-        if not image_path:
-            print("⚠️  Aucun chemin d'image spécifié")
-            return {'final_next': 'output'}
+        if not cd.image_path:
+            log.warning("Aucun chemin d'image spécifié")
+            return _OUT
+
+        # Déjà actif sur le composant: éviter un rechargement inutile
+        if self._showing('image', image_path=cd.image_path, layer=cd.layer):
+            return _OUT
 
         # Afficher l'image sur le layer spécifié
-        gui.show_component('image', image_path=image_path, layer=layer)
+        show('image', image_path=cd.image_path, layer=cd.layer)
 
         # Retourner le next par défaut
-        return {'final_next': 'output'}
+        return _OUT
+
+    def prefetch(self, node: Dict[str, Any], gui: Optional['GUI'] = None) -> None:
+        """Décode l'image en arrière-plan avant que le node ne soit atteint."""
+        if self._show is None:
+            return
+        cd = node['_compiled'][self.id]
+        if cd.image_path:
+            gui.prefetch_component('image', [cd.image_path])
 
-    def cleanup(self, memory: Memory, gui: Optional[GUI] = None) -> None:
+    def cleanup(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
         """Nettoyage du manager"""
         # Les images restent affichées, pas besoin de les cacher
-        pass
+        self._show = None
+        self._showing = None
 
     def validate_node(self, node: Dict[str, Any]) -> bool:
         """
@@ -2,10 +2,24 @@
 MassInitManager - Initialise plusieurs variables en une seule fois
 """
 
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT = MappingProxyType({'final_next': 'output'})
+
+
+@dataclass(slots=True)
+class MassInitData:
+    """Données précompilées d'un node massinit."""
+    variables: Dict[str, Any]
 
 
 class MassInitManager(INodeManager):
@@ -16,11 +30,34 @@ class MassInitManager(INodeManager):
     Définit 'final_next' à 'output' pour continuer.
     """
 
+    __slots__ = ()
+
     @property
     def id(self) -> str:
         return "massinit"
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+    def compile_node(self, node: Dict[str, Any]) -> MassInitData:
+        """
+        Précompile la liste des variables en dict {nom: valeur}.
+
+        Les entrées sans nom sont écartées ici plutôt qu'à chaque exécution.
+
+        Args:
+            node: Node avec {'data': {'variables': [{'name': '...', 'value': ...}, ...]}}
+
+        Returns:
+            MassInitData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        compiled = MassInitData(variables={
+            var.get('name', ''): var.get('value', 0)
+            for var in data.get('variables', [])
+            if var.get('name', '')  # Seulement si le nom n'est pas vide
+        })
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Initialise plusieurs variables.
 
@@ -31,16 +68,10 @@ class MassInitManager(INodeManager):
         Returns:
             {'final_next': 'output'}
         """
-        data = node.get('data', {})
-        variables = data.get('variables', [])
-
-        # Définir chaque variable
-        for var in variables:
-            name = var.get('name', '')
-            value = var.get('value', 0)
+        cd = node['_compiled'][self.id]
 
-            if name:  # Seulement si le nom n'est pas vide
-                memory.set(name, value)
+        # Définir toutes les variables d'un coup
+        memory.update(cd.variables)
 
         # Continuer au node suivant
-        return {'final_next': 'output'}
+        return _OUT
@@ -4,10 +4,30 @@ MusicManager - Joue de la musique avec système de pistes
 Gère la lecture de musique via le composant music du GUI avec support multi-pistes et repeat.
 """
 
-from typing import Dict, Any, Optional
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+log = logging.getLogger(__name__)
+
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT = MappingProxyType({'final_next': 'output'})
+
+
+@dataclass(slots=True)
+class MusicData:
+    """Données précompilées d'un node music."""
+    music_path: str
+    track: int
+    repeat: bool
 
 
 class MusicManager(INodeManager):
@@ -17,15 +37,43 @@ class MusicManager(INodeManager):
     Joue de la musique en utilisant le composant music du GUI avec système de pistes et option repeat.
     """
 
+    __slots__ = ('_show', '_showing')
+
+    def __init__(self):
+        # Méthodes du GUI mises en cache par initialize()
+        self._show = None
+        self._showing = None
+
     @property
     def id(self) -> str:
         return "music_manager"
 
-    def initialize(self, memory: Memory, gui: Optional[GUI] = None) -> None:
-        """Initialisation du manager"""
-        pass
+    def compile_node(self, node: Dict[str, Any]) -> MusicData:
+        """
+        Précompile les données d'un node music.
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+        Args:
+            node: Node avec music_path, track et repeat
+
+        Returns:
+            MusicData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        compiled = MusicData(
+            music_path=data.get('music_path', ''),
+            track=data.get('track', 0),
+            repeat=data.get('repeat', True)
+        )
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def initialize(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
+        """Initialisation du manager: met en cache les méthodes du GUI"""
+        if gui and gui.initialized:
+            self._show = gui.show_component
+            self._showing = gui.is_component_showing
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Traite un node music.
 
@@ -37,30 +85,41 @@ class MusicManager(INodeManager):
         Returns:
             Dictionnaire avec final_next
         """
-        if not gui:
-            print("⚠️  GUI non disponible, impossible de jouer la musique")
-            return {'final_next': 'output'}
+        show = self._show
+        if show is None:
+            log.warning("GUI non disponible, impossible de jouer la musique")
+            return _OUT
 
-        # Récupérer les données du node
-        data = node.get('data', {})
-        music_path = data.get('music_path', '')
-        track = data.get('track', 0)
-        repeat = data.get('repeat', True)
+        # Récupérer les données du node (précompilées)
+        cd = node['_compiled'][self.id]
 
-        if not music_path:
-            print("⚠️  Aucun chemin de musique spécifié")
-            return {'final_next': 'output'}
+        if not cd.music_path:
+            log.warning("Aucun chemin de musique spécifié")
+            return _OUT
+
+        # Déjà actif sur le composant: éviter un rechargement inutile
+        if self._showing('music', music_path=cd.music_path, track=cd.track, repeat=cd.repeat):
+            return _OUT
 
         # Jouer la musique sur la piste spécifiée avec le mode repeat
-        gui.show_component('music', music_path=music_path, track=track, repeat=repeat)
+        show('music', music_path=cd.music_path, track=cd.track, repeat=cd.repeat)
 
         # Retourner le next par défaut
-        return {'final_next': 'output'}
+        return _OUT
+
+    def prefetch(self, node: Dict[str, Any], gui: Optional['GUI'] = None) -> None:
+        """Prépare le fichier audio avant que le node ne soit atteint."""
+        if self._show is None:
+            return
+        cd = node['_compiled'][self.id]
+        if cd.music_path:
+            gui.prefetch_component('music', [cd.music_path])
 
-    def cleanup(self, memory: Memory, gui: Optional[GUI] = None) -> None:
+    def cleanup(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
         """Nettoyage du manager"""
         # La musique continue à jouer, pas besoin de l'arrêter
-        pass
+        self._show = None
+        self._showing = None
 
     def validate_node(self, node: Dict[str, Any]) -> bool:
         """
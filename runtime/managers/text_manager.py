@@ -3,10 +3,29 @@ TextDisplayManager - Affiche le contenu des nodes de texte avec interpolation de
 """
 
 import re
-from typing import Dict, Any, Optional
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+# Pattern pour trouver {{variable}} (compilé une seule fois)
+_VAR_PATTERN = re.compile(r'\{\{([^}]+)\}\}')
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT = MappingProxyType({'final_next': 'output', 'add_to_history': True})
+
+
+@dataclass(slots=True)
+class TextData:
+    """Données précompilées d'un node de texte."""
+    content: str
+    speaker: Optional[str]
+    character_image: str
 
 
 class TextDisplayManager(INodeManager):
@@ -20,6 +39,15 @@ class TextDisplayManager(INodeManager):
     Définit 'final_next' à 'output' pour continuer.
     """
 
+    __slots__ = ('_show', '_hide', '_showing', '_visible')
+
+    def __init__(self):
+        # Méthodes du GUI mises en cache par initialize() (None = mode console)
+        self._show = None
+        self._hide = None
+        self._showing = None
+        self._visible = None
+
     @property
     def id(self) -> str:
         return "text_display"
@@ -40,8 +68,9 @@ class TextDisplayManager(INodeManager):
             "Nom: {{player_name}}" → "Nom: Jack"
             "{{missing}}" → "{{missing}}" (si variable n'existe pas)
         """
-        # Pattern pour trouver {{variable}}
-        pattern = r'\{\{([^}]+)\}\}'
+        # Cas courant: aucun placeholder, pas besoin de lancer la regex
+        if '{{' not in text:
+            return text
 
         def replace_var(match):
             var_name = match.group(1).strip()
@@ -56,9 +85,61 @@ class TextDisplayManager(INodeManager):
             return str(value)
 
         # Remplacer toutes les occurrences
-        return re.sub(pattern, replace_var, text)
+        return _VAR_PATTERN.sub(replace_var, text)
+
+    def compile_node(self, node: Dict[str, Any]) -> TextData:
+        """
+        Précompile le contenu, le speaker et le portrait d'un node de texte.
+
+        Args:
+            node: Node avec {'data': {'content': '...', 'speaker': '...', 'character_image': '...'}}
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+        Returns:
+            TextData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        character_image = data.get('character_image', '') or ''
+        compiled = TextData(
+            content=data.get('content', ''),
+            speaker=data.get('speaker', None),
+            # Un chemin composé uniquement d'espaces équivaut à aucun portrait
+            character_image=character_image if character_image.strip() else ''
+        )
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def initialize(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
+        """
+        Met en cache les méthodes du GUI pour éviter les lookups à chaque node.
+
+        Le GUI est stable pendant toute la durée de vie du manager.
+
+        Args:
+            memory: Accès aux variables
+            gui: Accès au moteur GUI (optionnel)
+        """
+        if gui and gui.initialized:
+            self._show = gui.show_component
+            self._hide = gui.hide_component
+            self._showing = gui.is_component_showing
+            self._visible = gui.is_component_visible
+
+    def prefetch(self, node: Dict[str, Any], gui: Optional['GUI'] = None) -> None:
+        """Décode le portrait en arrière-plan avant que le node ne soit atteint."""
+        if self._show is None:
+            return
+        cd = node['_compiled'][self.id]
+        if cd.character_image:
+            gui.prefetch_component('character_portrait', [cd.character_image])
+
+    def cleanup(self, memory: Memory, gui: Optional['GUI'] = None) -> None:
+        """Oublie les méthodes du GUI mises en cache."""
+        self._show = None
+        self._hide = None
+        self._showing = None
+        self._visible = None
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Affiche le texte du node avec interpolation des variables.
 
@@ -70,10 +151,10 @@ class TextDisplayManager(INodeManager):
         Returns:
             {'final_next': 'output'}
         """
-        data = node.get('data', {})
-        content = data.get('content', '')
-        speaker = data.get('speaker', None)
-        character_image = data.get('character_image', '')
+        cd = node['_compiled'][self.id]
+        content = cd.content
+        speaker = cd.speaker
+        character_image = cd.character_image
 
         # Parser les variables dans le contenu
         parsed_content = self._parse_variables(content, memory)
@@ -83,16 +164,19 @@ class TextDisplayManager(INodeManager):
             speaker = self._parse_variables(speaker, memory)
 
         # Afficher avec le GUI si disponible
-        if gui and gui.initialized:
-            # Afficher le portrait du personnage si spécifié
-            if character_image and character_image.strip():
-                gui.show_component('character_portrait', image_path=character_image)
-            else:
+        show = self._show
+        if show is not None:
+            # Afficher le portrait du personnage si spécifié et pas déjà affiché
+            # (état lu sur le composant: reste juste après retour arrière ou chargement)
+            if character_image:
+                if not self._showing('character_portrait', image_path=character_image):
+                    show('character_portrait', image_path=character_image)
+            elif self._visible('character_portrait'):
                 # Cacher le portrait s'il n'y a pas d'image
-                gui.hide_component('character_portrait')
+                self._hide('character_portrait')
 
             # Afficher le texte
-            gui.show_component('text_dialog', text=parsed_content, speaker=speaker)
+            show('text_dialog', text=parsed_content, speaker=speaker)
         else:
             # Fallback: affichage console
             print("\n" + "=" * 50)
@@ -104,4 +188,4 @@ class TextDisplayManager(INodeManager):
 
         # Continuer au node suivant via le port 'output'
         # Ajouter ce node à l'historique car il attend une interaction utilisateur
-        return {'final_next': 'output', 'add_to_history': True}
+        return _OUT
@@ -2,10 +2,31 @@
 VariableSetterManager - Modifie les variables dans la Memory
 """
 
-from typing import Dict, Any, Optional
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, Callable, TYPE_CHECKING
 from ..core.interfaces.node_manager_interface import INodeManager
 from ..core.memory import Memory
-from ..ui.gui import GUI
+
+if TYPE_CHECKING:
+    from ..ui.gui import GUI
+
+
+log = logging.getLogger(__name__)
+
+
+# Résultats partagés en lecture seule (retournés tels quels à chaque appel)
+_OUT = MappingProxyType({'final_next': 'output'})
+
+
+@dataclass(slots=True)
+class VariableData:
+    """Données précompilées d'un node de variable."""
+    variable: str
+    operation: str
+    value: Any
+    op: Optional[Callable[[Memory, str, Any], Any]]
 
 
 class VariableSetterManager(INodeManager):
@@ -16,11 +37,43 @@ class VariableSetterManager(INodeManager):
     Définit 'final_next' à 'output' pour continuer.
     """
 
+    __slots__ = ()
+
+    # Table de dispatch: opération → méthode de Memory
+    _OPS: Dict[str, Callable[[Memory, str, Any], Any]] = {
+        'set': Memory.set,
+        'add': Memory.add,
+        'subtract': Memory.subtract,
+        'multiply': Memory.multiply,
+    }
+
     @property
     def id(self) -> str:
         return "variable_setter"
 
-    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional[GUI] = None) -> Dict[str, Any]:
+    def compile_node(self, node: Dict[str, Any]) -> VariableData:
+        """
+        Précompile la variable, l'opération et la valeur d'un node.
+
+        Args:
+            node: Node avec {'data': {'variable': '...', 'operation': '...', 'value': ...}}
+
+        Returns:
+            VariableData (aussi stocké dans node['_compiled'][self.id])
+        """
+        data = node.get('data', {})
+        operation = data.get('operation', 'set')
+        compiled = VariableData(
+            variable=data.get('variable', 'var'),
+            operation=operation,
+            value=data.get('value', 0),
+            # Résoudre la méthode une seule fois (None si opération inconnue)
+            op=self._OPS.get(operation)
+        )
+        node.setdefault('_compiled', {})[self.id] = compiled
+        return compiled
+
+    def process(self, node: Dict[str, Any], memory: Memory, gui: Optional['GUI'] = None) -> Dict[str, Any]:
         """
         Modifie une variable selon l'opération spécifiée.
 
@@ -31,25 +84,13 @@ class VariableSetterManager(INodeManager):
         Returns:
             {'final_next': 'output'}
         """
-        data = node.get('data', {})
-        variable = data.get('variable', 'var')
-        operation = data.get('operation', 'set')
-        value = data.get('value', 0)
-
-        # Exécuter l'opération
-        if operation == 'set':
-            memory.set(variable, value)
-        elif operation == 'add':
-            memory.add(variable, value)
-        elif operation == 'subtract':
-            memory.subtract(variable, value)
-        elif operation == 'multiply':
-            memory.multiply(variable, value)
-        else:
-            print(f"Opération inconnue: {operation}")
+        cd = node['_compiled'][self.id]
 
-        # Debug: afficher l'opération (optionnel)
-        # print(f"[Debug] {variable} = {memory.get(variable)}")
+        # Exécuter l'opération (méthode résolue à la précompilation)
+        if cd.op is not None:
+            cd.op(memory, cd.variable, cd.value)
+        else:
+            log.error("Opération inconnue: %s", cd.operation)
 
         # Continuer au node suivant
-        return {'final_next': 'output'}
+        return _OUT
@@ -2,20 +2,21 @@
 UI - Interface utilisateur PyQt6 pour le runtime
 
 Ce module contient le moteur GUI et les composants visuels.
+Qt n'est chargé qu'au premier accès à l'un d'eux (PEP 562).
 """
 
-from .gui import GUI, GUIComponent, GameWindow
-from .components import (
-    TextDialogComponent,
-    ChoiceDialogComponent,
-    ImageComponent,
-)
+from ..core.lazy import lazy_exports
 
-__all__ = [
-    'GUI',
-    'GUIComponent',
-    'GameWindow',
-    'TextDialogComponent',
-    'ChoiceDialogComponent',
-    'ImageComponent',
-]
+# Nom exporté → sous-module qui le définit
+_LAZY = {
+    'GUI': 'gui',
+    'GUIComponent': 'gui',
+    'GameWindow': 'gui',
+    'TextDialogComponent': 'components',
+    'ChoiceDialogComponent': 'components',
+    'ImageComponent': 'components',
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
@@ -2,22 +2,23 @@
 Components - Composants GUI pour le runtime
 
 Ce module contient les composants de base et permet l'ajout de composants custom.
+Les sous-modules (et Qt) sont importés à la demande (PEP 562), au premier accès
+au composant correspondant.
 """
 
-from .text_dialog import TextDialogComponent
-from .choice_dialog import ChoiceDialogComponent
-from .image import ImageComponent
-from .game_menu import GameMenuComponent
-from .pause_menu import PauseMenuComponent
-from .music import MusicComponent
-from .character_portrait import CharacterPortraitComponent
+from ...core.lazy import lazy_exports
 
-__all__ = [
-    'TextDialogComponent',
-    'ChoiceDialogComponent',
-    'ImageComponent',
-    'GameMenuComponent',
-    'PauseMenuComponent',
-    'MusicComponent',
-    'CharacterPortraitComponent',
-]
+# Nom de classe → sous-module qui la définit
+_LAZY = {
+    'TextDialogComponent': 'text_dialog',
+    'ChoiceDialogComponent': 'choice_dialog',
+    'ImageComponent': 'image',
+    'GameMenuComponent': 'game_menu',
+    'PauseMenuComponent': 'pause_menu',
+    'MusicComponent': 'music',
+    'CharacterPortraitComponent': 'character_portrait',
+}
+
+__all__ = list(_LAZY)
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY)
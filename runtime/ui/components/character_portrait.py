@@ -2,19 +2,29 @@
 CharacterPortrait - Composant pour afficher l'image d'un personnage dans les dialogues
 """
 
-from typing import Optional
-from pathlib import Path
+from typing import Optional, List, Tuple
 from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtGui import QPixmap
 from ..gui import GUIComponent, GUI
+from .pixmap_cache import find_pixmap, path_exists, prefetch_pixmap, request_pixmap
 
 
 class CharacterPortraitWidget(QWidget):
     """Widget Qt pour afficher le portrait d'un personnage."""
 
+    # Hauteur d'affichage du portrait (px)
+    MAX_HEIGHT = 300
+
+    # Taille de décodage: seule la hauteur compte
+    DECODE_BOUND = QSize(1, MAX_HEIGHT)
+
     def __init__(self):
         super().__init__()
+        # Dernière image demandée (le décodage peut être en cours)
+        self._requested_path: Optional[str] = None
+        # Image actuellement affichée
+        self._current_path: Optional[str] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -27,49 +37,86 @@ class CharacterPortraitWidget(QWidget):
         # Style par défaut (transparent)
         self.image_label.setStyleSheet("background-color: transparent;")
 
-    def set_image(self, image_path: str):
+        # Portrait déjà mis à la hauteur d'affichage (None = à recalculer)
+        self._scaled_pixmap: Optional[QPixmap] = None
+
+    def set_image(self, image_path: str, entry: Optional[Tuple[str, str]] = None):
         """
         Définit l'image du personnage.
 
         Args:
             image_path: Chemin vers l'image
+            entry: Clé de cache déjà obtenue par find_pixmap() (None = la calculer)
         """
-        if not Path(image_path).exists():
+        self._requested_path = image_path
+        # Déjà affichée: ni accès disque, ni décodage, ni mise à l'échelle
+        if image_path == self._current_path:
+            return
+        self._current_path = None
+
+        if not path_exists(image_path):
             print(f"⚠️  Image de personnage introuvable: {image_path}")
             self.clear_image()
             return
 
-        # Charger l'image
-        pixmap = QPixmap(image_path)
+        # Charger l'image: depuis le cache, sinon décodage hors du thread GUI
+        # Décodé directement à la hauteur d'affichage
+        pixmap = request_pixmap(image_path, self._on_pixmap_loaded, self.DECODE_BOUND, entry)
+        if pixmap is not None:
+            self.set_pixmap(pixmap, image_path)
+
+    def _on_pixmap_loaded(self, image_path: str, pixmap: QPixmap):
+        """Reçoit une image décodée en arrière-plan (thread GUI)."""
+        # Ignorer une image arrivée après qu'une autre a été demandée
+        if image_path == self._requested_path:
+            self.set_pixmap(pixmap, image_path)
+
+    def set_pixmap(self, pixmap: QPixmap, image_path: Optional[str] = None):
+        """
+        Affiche une image déjà décodée (ni accès disque, ni recherche dans le cache).
+
+        Args:
+            pixmap: Image décodée (nulle si le chargement a échoué)
+            image_path: Chemin d'origine de l'image (pour les messages et set_image)
+        """
+        self._requested_path = image_path
         if pixmap.isNull():
-            print(f"⚠️  Impossible de charger l'image: {image_path}")
+            print(f"⚠️  Impossible de charger l'image: {self._requested_path}")
             self.clear_image()
             return
 
         # Adapter l'image à une taille fixe tout en gardant les proportions
         self.original_pixmap = pixmap
+        self._scaled_pixmap = None
+        self._current_path = image_path
         self.update_pixmap()
 
     def update_pixmap(self):
         """Met à jour l'affichage de l'image en respectant les proportions."""
         if hasattr(self, 'original_pixmap'):
-            # Redimensionner à une hauteur fixe (réduit à 300px)
-            max_height = 300
-            scaled_pixmap = self.original_pixmap.scaledToHeight(
-                max_height,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+            # Redimensionner à une hauteur fixe (réduit à 300px), une seule fois par image
+            if self._scaled_pixmap is None:
+                if self.original_pixmap.height() == self.MAX_HEIGHT:
+                    # Déjà décodé à la bonne hauteur
+                    self._scaled_pixmap = self.original_pixmap
+                else:
+                    self._scaled_pixmap = self.original_pixmap.scaledToHeight(
+                        self.MAX_HEIGHT,
+                        Qt.TransformationMode.SmoothTransformation
+                    )
+            self.image_label.setPixmap(self._scaled_pixmap)
             self.image_label.adjustSize()
             self.adjustSize()
 
     def clear_image(self):
         """Efface l'image du personnage."""
+        self._current_path = None
+        self._scaled_pixmap = None
         self.image_label.clear()
         self.image_label.setPixmap(QPixmap())
 
     def resizeEvent(self, event):
-        """Redimensionne l'image quand le widget change de taille."""
+        """Suit la taille du widget (le portrait garde sa hauteur fixe: pas de remise à l'échelle)."""
         super().resizeEvent(event)
         self.image_label.setGeometry(self.rect())
 
@@ -110,8 +157,13 @@ class CharacterPortraitComponent(GUIComponent):
         if self.widget is None:
             self.widget = self.create_widget()
 
-        # Mettre à jour l'image
-        self.widget.set_image(image_path)
+        # Mettre à jour l'image: directement si déjà décodée (préchargement), sinon via le widget
+        # (la clé de cache est repassée au widget: pas de second calcul en cas d'absence)
+        pixmap, entry = find_pixmap(image_path, CharacterPortraitWidget.DECODE_BOUND)
+        if pixmap is not None:
+            self.widget.set_pixmap(pixmap, image_path)
+        else:
+            self.widget.set_image(image_path, entry)
 
         # Ajouter à la fenêtre
         if self.gui.window:
@@ -119,15 +171,37 @@ class CharacterPortraitComponent(GUIComponent):
 
     def hide(self) -> None:
         """Cache le composant."""
+        # Le widget est gardé (caché) pour le prochain affichage
         if self.gui.window and self.widget:
-            self.gui.window.remove_component_widget('character_portrait')
+            self.gui.window.detach_component_widget('character_portrait')
 
         self.visible = False
         if self.widget:
             self.widget.clear_image()
-        self.widget = None
         self.image_path = None
 
+    def is_showing(self, image_path: str = '', **kwargs) -> bool:
+        """
+        Indique si ce portrait est déjà affiché.
+
+        Args:
+            image_path: Chemin vers l'image du personnage
+
+        Returns:
+            True si le portrait affiché est déjà celui-ci
+        """
+        return self.visible and self.image_path == image_path
+
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Décode en arrière-plan des portraits qui seront bientôt affichés.
+
+        Args:
+            paths: Chemins des images de personnage
+        """
+        for image_path in paths:
+            prefetch_pixmap(image_path, CharacterPortraitWidget.DECODE_BOUND)
+
     def update(self, image_path: Optional[str] = None, **kwargs) -> None:
         """
         Met à jour l'image du personnage.
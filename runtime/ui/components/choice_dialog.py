@@ -14,35 +14,41 @@ from ...config import (
 )
 
 
+# Feuilles de style construites une fois, à l'import du module
+# Container des choix et ses boutons
+_CHOICE_BOX_QSS = f"""
+    QWidget {{
+        background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {CHOICE_BOX_OPACITY});
+        border: 1px solid rgba(255, 255, 255, {BORDER_OPACITY});
+        border-radius: {BORDER_RADIUS}px;
+    }}
+    #ChoiceBox QPushButton {{
+        background-color: transparent;
+        color: {CHOICE_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_CHOICE}px;
+        font-weight: {FONT_WEIGHT_CHOICE};
+        border: none;
+        border-bottom: 1px solid rgba(255, 255, 255, 0.3);
+        padding: {CHOICE_BOX_PADDING}px 25px;
+        text-align: left;
+    }}
+    #ChoiceBox QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 0.5);
+    }}
+    #ChoiceBox QPushButton:pressed {{
+        background-color: rgba(255, 255, 255, 0.7);
+    }}
+"""
+
+
 class ChoiceButton(QPushButton):
     """Bouton stylisé pour un choix - design minimaliste."""
 
     def __init__(self, text: str, index: int):
         super().__init__(text)
         self.choice_index = index
-        self.setup_style()
-
-    def setup_style(self):
-        """Configure le style du bouton (utilise config)."""
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: transparent;
-                color: {CHOICE_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_CHOICE}px;
-                font-weight: {FONT_WEIGHT_CHOICE};
-                border: none;
-                border-bottom: 1px solid rgba(255, 255, 255, 0.3);
-                padding: {CHOICE_BOX_PADDING}px 25px;
-                text-align: left;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 0.5);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(255, 255, 255, 0.7);
-            }}
-        """)
+        # Style porté par le container (#ChoiceBox): une seule feuille pour tous les boutons
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
 
@@ -51,9 +57,16 @@ class ChoiceDialogWidget(QWidget):
 
     choice_selected = pyqtSignal(int)
 
+    # Nombre de boutons gardés en réserve entre deux dialogues
+    BUTTON_POOL_MAX = 8
+
     def __init__(self):
         super().__init__()
+        # Pool de boutons: seuls les choice_count premiers sont affichés
         self.buttons: List[ChoiceButton] = []
+        self.choice_count = 0
+        # Choix actuellement affichés (pour éviter de refaire un contenu identique)
+        self._choices: Optional[List[Dict[str, Any]]] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -62,14 +75,10 @@ class ChoiceDialogWidget(QWidget):
         self.setStyleSheet("background-color: transparent;")
 
         # Container pour les choix (utilise config)
+        # Style des boutons inclus ici: parsé une fois pour tout le pool
         self.choice_container = QWidget(self)
-        self.choice_container.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {CHOICE_BOX_OPACITY});
-                border: 1px solid rgba(255, 255, 255, {BORDER_OPACITY});
-                border-radius: {BORDER_RADIUS}px;
-            }}
-        """)
+        self.choice_container.setObjectName("ChoiceBox")
+        self.choice_container.setStyleSheet(_CHOICE_BOX_QSS)
 
         # Layout pour le contenu du container
         self.choice_layout = QVBoxLayout(self.choice_container)
@@ -95,43 +104,66 @@ class ChoiceDialogWidget(QWidget):
     def resizeEvent(self, event):
         """Repositionne le container au centre quand le widget est redimensionné."""
         super().resizeEvent(event)
+        size = event.size()
+        self._reposition_container(size.width(), size.height())
+
+    def _reposition_container(self, width: int, height: int):
+        """
+        Ajuste le container à son contenu et le centre dans le widget.
 
+        Args:
+            width: Largeur du widget
+            height: Hauteur du widget
+        """
         # Ajuster la taille du container en fonction du contenu
         self.choice_container.adjustSize()
 
         # Centrer le container, mais laisser de l'espace en bas pour le TextDialog
-        container_width = min(700, self.width() - 100)
+        container_width = min(700, width - 100)
         container_height = self.choice_container.sizeHint().height()
 
         # Réserver de l'espace pour le TextDialog en bas (environ 400px)
-        available_height = self.height() - 420  # Espace pour TextDialog + marge
+        available_height = height - 420  # Espace pour TextDialog + marge
 
-        x = (self.width() - container_width) // 2
+        x = (width - container_width) // 2
         y = max(50, (available_height - container_height) // 2)  # Centré dans l'espace disponible
 
         self.choice_container.setGeometry(x, y, container_width, container_height)
 
     def set_content(self, question: str, choices: List[Dict[str, Any]]):
         """Définit le contenu du dialogue de choix."""
+        # Même choix réaffiché (widget réutilisé): rien à reconstruire
+        if choices is self._choices and question == self.question_label.text():
+            return
+        self._choices = choices
         self.question_label.setText(question)
 
-        # Supprimer les anciens boutons
-        for button in self.buttons:
-            self.choice_layout.removeWidget(button)
-            button.deleteLater()
-        self.buttons.clear()
-
-        # Créer les nouveaux boutons
+        # Réutiliser les boutons existants (évite de reparser la feuille de style)
         for i, choice in enumerate(choices):
             choice_text = choice.get('text', f'Choix {i+1}')
-            button = ChoiceButton(choice_text, i)
-            button.clicked.connect(lambda checked, idx=i: self.choice_selected.emit(idx))
-            self.choice_layout.addWidget(button)
-            self.buttons.append(button)
+            if i < len(self.buttons):
+                button = self.buttons[i]
+                button.setText(choice_text)
+            else:
+                # L'index d'un bouton du pool ne change jamais: connexion unique
+                button = ChoiceButton(choice_text, i)
+                button.clicked.connect(lambda checked, idx=i: self.choice_selected.emit(idx))
+                self.choice_layout.addWidget(button)
+                self.buttons.append(button)
+            button.show()
+
+        # Cacher les boutons en trop, supprimer ceux au-delà de la taille du pool
+        keep = max(len(choices), self.BUTTON_POOL_MAX)
+        for button in self.buttons[len(choices):keep]:
+            button.hide()
+        for button in self.buttons[keep:]:
+            self.choice_layout.removeWidget(button)
+            button.deleteLater()
+        del self.buttons[keep:]
+        self.choice_count = len(choices)
 
-        # Forcer la mise à jour de la taille
-        self.choice_container.adjustSize()
-        self.resizeEvent(None)
+        # Le nombre de choix a pu changer: recalculer la géométrie du container
+        self._reposition_container(self.width(), self.height())
 
     def keyPressEvent(self, event):
         """Détecte les touches numériques pour sélectionner un choix."""
@@ -139,7 +171,7 @@ class ChoiceDialogWidget(QWidget):
         # Touches 1-9
         if Qt.Key.Key_1 <= key <= Qt.Key.Key_9:
             choice_idx = key - Qt.Key.Key_1
-            if choice_idx < len(self.buttons):
+            if choice_idx < self.choice_count:
                 self.choice_selected.emit(choice_idx)
 
 
@@ -199,14 +231,15 @@ class ChoiceDialogComponent(GUIComponent):
 
     def hide(self) -> None:
         """Cache le composant."""
+        # Le widget est gardé (caché) pour le prochain affichage
         if self.gui.window and self.widget:
-            self.gui.window.remove_component_widget('choice_dialog')
+            self.gui.window.detach_component_widget('choice_dialog')
 
         self.visible = False
-        self.widget = None
         self.question = ""
         self.choices = []
         self._selected_choice = None
+        self._stop_waiting()
 
     def update(self, question: Optional[str] = None, choices: Optional[List[Dict[str, Any]]] = None, **kwargs) -> None:
         """
@@ -228,24 +261,22 @@ class ChoiceDialogComponent(GUIComponent):
     def _on_choice_selected(self, choice_idx: int):
         """Appelé quand l'utilisateur sélectionne un choix."""
         self._selected_choice = choice_idx
+        self._stop_waiting()
 
     def _wait_for_choice(self) -> int:
         """Attend que l'utilisateur sélectionne un choix."""
-        import time
-
         self._selected_choice = None
         self._waiting = True
 
-        # Boucle d'attente avec process events et petit délai
-        while self._selected_choice is None and self.visible:
-            # Vérifier si un retour en arrière est demandé
-            if self.gui.engine and self.gui.engine._go_back_requested:
-                self._waiting = False
-                self.hide()
-                return 0
+        # Attente événementielle: réveillée par un choix, hide() ou un retour en arrière ou au menu
+        if not (self.gui.engine and self.gui.engine.interaction_interrupted):
+            self._wait(interruptible=True)
 
-            self.gui.process_events()
-            time.sleep(0.01)
+        # Retour en arrière ou au menu demandé
+        if self.gui.engine and self.gui.engine.interaction_interrupted:
+            self._waiting = False
+            self.hide()
+            return 0
 
         self._waiting = False
         result = self._selected_choice if self._selected_choice is not None else 0
@@ -4,7 +4,7 @@ GameMenu - Menu principal du jeu (Nouveau/Charger/Quitter)
 
 from typing import Optional, Callable
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, pyqtSlot
 from ..gui import GUIComponent, GUI
 from ...config import (
     FONT_FAMILY, FONT_SIZE_MENU, FONT_WEIGHT_MENU,
@@ -13,33 +13,51 @@ from ...config import (
 )
 
 
+# Feuilles de style construites une fois, à l'import du module
+# Container du menu et ses boutons
+_MENU_BOX_QSS = f"""
+    QWidget {{
+        background-color: rgba(200, 200, 205, 255);
+        border: none;
+    }}
+    #MenuBox QPushButton {{
+        background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {MENU_BOX_OPACITY});
+        color: {TEXT_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_MENU}px;
+        font-weight: {FONT_WEIGHT_MENU};
+        border: none;
+        padding: 20px 40px;
+        margin: 8px 0px;
+    }}
+    #MenuBox QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 255);
+    }}
+    #MenuBox QPushButton:pressed {{
+        background-color: rgba(220, 220, 225, 255);
+    }}
+"""
+
+# Titre du menu
+_TITLE_QSS = f"""
+    QLabel {{
+        color: {TEXT_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: 32px;
+        font-weight: bold;
+        padding-bottom: 30px;
+        background-color: transparent;
+    }}
+"""
+
+
 class MenuButton(QPushButton):
     """Bouton de menu stylisé."""
 
-    def __init__(self, text: str):
+    def __init__(self, text: str, action: str):
         super().__init__(text)
-        self.setup_style()
-
-    def setup_style(self):
-        """Configure le style du bouton."""
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {MENU_BOX_OPACITY});
-                color: {TEXT_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_MENU}px;
-                font-weight: {FONT_WEIGHT_MENU};
-                border: none;
-                padding: 20px 40px;
-                margin: 8px 0px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 255);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(220, 220, 225, 255);
-            }}
-        """)
+        self.action = action
+        # Style porté par le container (#MenuBox): une seule feuille pour tous les boutons
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
 
@@ -57,13 +75,10 @@ class GameMenuWidget(QWidget):
         self.setStyleSheet("background-color: transparent;")
 
         # Container centré
+        # Style des boutons inclus ici: parsé une fois pour tout le menu
         self.menu_container = QWidget(self)
-        self.menu_container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(200, 200, 205, 255);
-                border: none;
-            }
-        """)
+        self.menu_container.setObjectName("MenuBox")
+        self.menu_container.setStyleSheet(_MENU_BOX_QSS)
 
         layout = QVBoxLayout(self.menu_container)
         layout.setContentsMargins(60, 60, 60, 60)
@@ -71,32 +86,29 @@ class GameMenuWidget(QWidget):
 
         # Titre
         title_label = QLabel("Choice Game Engine")
+        title_label.setTextFormat(Qt.TextFormat.PlainText)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: 32px;
-                font-weight: bold;
-                padding-bottom: 30px;
-                background-color: transparent;
-            }}
-        """)
+        title_label.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title_label)
 
-        # Boutons
-        new_button = MenuButton("Nouvelle Partie")
-        new_button.clicked.connect(lambda: self.action_selected.emit('new'))
+        # Boutons: un seul slot pour tous, l'action est portée par le bouton
+        new_button = MenuButton("Nouvelle Partie", 'new')
+        new_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(new_button)
 
-        load_button = MenuButton("Charger")
-        load_button.clicked.connect(lambda: self.action_selected.emit('load'))
+        load_button = MenuButton("Charger", 'load')
+        load_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(load_button)
 
-        quit_button = MenuButton("Quitter")
-        quit_button.clicked.connect(lambda: self.action_selected.emit('quit'))
+        quit_button = MenuButton("Quitter", 'quit')
+        quit_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(quit_button)
 
+    @pyqtSlot()
+    def _on_button_clicked(self):
+        """Émet l'action du bouton cliqué."""
+        self.action_selected.emit(self.sender().action)
+
     def resizeEvent(self, event):
         """Repositionne le container au centre."""
         super().resizeEvent(event)
@@ -150,12 +162,13 @@ class GameMenuComponent(GUIComponent):
 
     def hide(self) -> None:
         """Cache le composant."""
+        # Le widget est gardé (caché) pour le prochain affichage
         if self.gui.window and self.widget:
-            self.gui.window.remove_component_widget('game_menu')
+            self.gui.window.detach_component_widget('game_menu')
 
         self.visible = False
-        self.widget = None
         self._selected_action = None
+        self._stop_waiting()
 
     def update(self, **kwargs) -> None:
         """Met à jour le composant."""
@@ -164,17 +177,15 @@ class GameMenuComponent(GUIComponent):
     def _on_action_selected(self, action: str):
         """Appelé quand l'utilisateur sélectionne une action."""
         self._selected_action = action
+        self._stop_waiting()
 
     def _wait_for_action(self) -> str:
         """Attend que l'utilisateur sélectionne une action."""
-        import time
-
         self._selected_action = None
         self._waiting = True
 
-        while self._selected_action is None and self.visible:
-            self.gui.process_events()
-            time.sleep(0.01)
+        # Attente événementielle: réveillée par une action ou hide()
+        self._wait()
 
         self._waiting = False
         result = self._selected_action or 'quit'
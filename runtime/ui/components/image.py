@@ -2,19 +2,85 @@
 Image - Composant d'image avec système de layers pour jeux à choix
 """
 
-from typing import Optional, Dict
-from pathlib import Path
+from functools import partial
+from typing import Optional, Dict, List, Tuple
+from PyQt6 import sip
 from PyQt6.QtWidgets import QWidget, QLabel
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import Qt, QSize, QTimer
+from PyQt6.QtGui import QImage, QPixmap
 from ..gui import GUIComponent, GUI
+from .image_tasks import start_image_task
+from .pixmap_cache import find_pixmap, path_exists, prefetch_pixmap, request_pixmap
+
+
+def _decode_bound(widget: Optional[QWidget]) -> QSize:
+    """
+    Taille maximale d'affichage: l'écran (la fenêtre ne peut pas être plus grande).
+
+    Args:
+        widget: Widget dont l'écran est utilisé (None = écran par défaut)
+
+    Returns:
+        Taille que l'image décodée doit couvrir
+    """
+    screen = widget.screen() if widget is not None else None
+    return screen.size() if screen is not None else QSize(1920, 1080)
+
+
+def _scale_smooth(image: QImage, size: QSize) -> QImage:
+    """Mise à l'échelle lissée (thread du pool): QImage.scaled est réentrant."""
+    return image.scaled(
+        size,
+        Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+        Qt.TransformationMode.SmoothTransformation
+    )
+
+
+def _start_scaling(widget: 'ImageWidget', image: QImage, size: QSize, generation: int) -> None:
+    """
+    Lance une mise à l'échelle lissée sur le QThreadPool.
+
+    Args:
+        widget: Widget qui recevra le résultat
+        image: Image source
+        size: Taille à couvrir
+        generation: Génération du widget au lancement (résultat ignoré si dépassée)
+    """
+    start_image_task(partial(_scale_smooth, image, size), partial(_on_scaled, widget, generation))
+
+
+def _on_scaled(widget: 'ImageWidget', generation: int, image: QImage) -> None:
+    """
+    Reçoit un rendu lissé sur le thread GUI et le transmet au widget.
+
+    Args:
+        widget: Widget ayant demandé la mise à l'échelle
+        generation: Génération du widget au lancement
+        image: Image mise à l'échelle
+    """
+    # Le widget a pu être détruit (deleteLater) pendant la mise à l'échelle
+    if not sip.isdeleted(widget):
+        widget._on_scaled(generation, image)
 
 
 class ImageWidget(QWidget):
     """Widget Qt pour afficher une image."""
 
+    # Réduction (px) en dessous de laquelle l'image déjà mise à l'échelle est gardée
+    RESCALE_THRESHOLD = 4
+
+    # Délai (ms) de regroupement des resize: un seul redimensionnement par frame
+    RESIZE_DEBOUNCE_MS = 16
+
+    # Délai (ms) sans resize avant le rendu final lissé
+    SMOOTH_DELAY_MS = 100
+
     def __init__(self):
         super().__init__()
+        # Dernière image demandée (le décodage peut être en cours)
+        self._requested_path: Optional[str] = None
+        # Image actuellement affichée
+        self._current_path: Optional[str] = None
         self.setup_ui()
 
     def setup_ui(self):
@@ -25,14 +91,36 @@ class ImageWidget(QWidget):
         self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.image_label.setStyleSheet("background-color: transparent;")
 
-    def set_image(self, image_path: str):
+        # Taille de la dernière mise à l'échelle et resize en attente
+        self._last_scaled_size = QSize()
+        self._last_scaled_smooth = False
+        self._rescale_pending = False
+
+        # Rendu lissé une fois le redimensionnement terminé
+        self._finalize_timer = QTimer(self)
+        self._finalize_timer.setSingleShot(True)
+        self._finalize_timer.setInterval(self.SMOOTH_DELAY_MS)
+        self._finalize_timer.timeout.connect(self.update_pixmap)
+
+        # Rendu lissé hors du thread GUI: seul le résultat de la dernière demande est affiché
+        self._scale_generation = 0
+        self._scale_size = QSize()
+
+    def set_image(self, image_path: str, entry: Optional[Tuple[str, str]] = None):
         """
         Définit l'image.
 
         Args:
             image_path: Chemin vers l'image
+            entry: Clé de cache déjà obtenue par find_pixmap() (None = la calculer)
         """
-        if not Path(image_path).exists():
+        self._requested_path = image_path
+        # Déjà affichée: ni accès disque, ni décodage, ni mise à l'échelle
+        if image_path == self._current_path:
+            return
+        self._current_path = None
+
+        if not path_exists(image_path):
             print(f"⚠️  Image introuvable: {image_path}")
             self.image_label.setText("Image introuvable")
             self.image_label.setStyleSheet("""
@@ -42,39 +130,141 @@ class ImageWidget(QWidget):
                     font-size: 16px;
                 }
             """)
+            self._update_opaque()
             return
 
-        # Charger l'image
-        pixmap = QPixmap(image_path)
+        # Charger l'image: depuis le cache, sinon décodage hors du thread GUI
+        # (l'image précédente reste affichée en attendant, sans flash)
+        pixmap = request_pixmap(image_path, self._on_pixmap_loaded, _decode_bound(self), entry)
+        if pixmap is not None:
+            self.set_pixmap(pixmap, image_path)
+
+    def _on_pixmap_loaded(self, image_path: str, pixmap: QPixmap):
+        """Reçoit une image décodée en arrière-plan (thread GUI)."""
+        # Ignorer une image arrivée après qu'une autre a été demandée
+        if image_path == self._requested_path:
+            self.set_pixmap(pixmap, image_path)
+
+    def set_pixmap(self, pixmap: QPixmap, image_path: Optional[str] = None):
+        """
+        Affiche une image déjà décodée (ni accès disque, ni recherche dans le cache).
+
+        Args:
+            pixmap: Image décodée (nulle si le chargement a échoué)
+            image_path: Chemin d'origine de l'image (pour les messages et set_image)
+        """
+        self._requested_path = image_path
         if pixmap.isNull():
-            print(f"⚠️  Impossible de charger l'image: {image_path}")
+            print(f"⚠️  Impossible de charger l'image: {self._requested_path}")
             self.image_label.setText("Erreur de chargement")
+            self._update_opaque()
             return
 
-        # Adapter l'image à la taille du widget
+        # Garder la source en QImage: utilisable par les threads de mise à l'échelle
+        # (la QPixmap, partagée avec le cache, sert quand aucune mise à l'échelle n'est nécessaire)
         self.original_pixmap = pixmap
+        self.original_image = pixmap.toImage()
+        self._current_path = image_path
+        self._last_scaled_size = QSize()  # Nouvelle image: toujours remettre à l'échelle
         self.update_pixmap()
 
-    def update_pixmap(self):
-        """Met à jour l'affichage de l'image en respectant les proportions."""
-        if hasattr(self, 'original_pixmap'):
-            scaled_pixmap = self.original_pixmap.scaled(
-                self.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.image_label.setPixmap(scaled_pixmap)
+    def update_pixmap(self, fast: bool = False):
+        """
+        Met à jour l'affichage de l'image en respectant les proportions.
+
+        Args:
+            fast: Mise à l'échelle rapide (sans lissage) pendant un redimensionnement
+        """
+        if hasattr(self, 'original_image'):
+            target = self.size()
+            last = self._last_scaled_size
+
+            # Taille identique ou légèrement réduite: l'image actuelle couvre encore le widget
+            # (sauf pour remplacer un rendu rapide par le rendu lissé)
+            if (last.isValid() and (fast or self._last_scaled_smooth) and
+                    0 <= last.width() - target.width() < self.RESCALE_THRESHOLD and
+                    0 <= last.height() - target.height() < self.RESCALE_THRESHOLD):
+                return
+
+            # Invalider un rendu lissé encore en cours
+            self._scale_generation += 1
+
+            # Source déjà à la bonne taille (décodée à la taille de l'écran): aucune mise à l'échelle
+            source = self.original_image.size()
+            if source.scaled(target, Qt.AspectRatioMode.KeepAspectRatioByExpanding) == source:
+                self._display(self.original_pixmap)
+                self._last_scaled_size = QSize(target)
+                self._last_scaled_smooth = True
+                return
+
+            # Rendu rapide immédiat (redimensionnement, ou nouvelle image pas encore affichée)
+            if fast or not last.isValid():
+                scaled_image = self.original_image.scaled(
+                    target,
+                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                    Qt.TransformationMode.FastTransformation
+                )
+                self._display(QPixmap.fromImage(scaled_image))
+                self._last_scaled_size = QSize(target)
+                self._last_scaled_smooth = False
+                if fast:
+                    return
+
+            # Rendu lissé sur le QThreadPool (les layers sont mis à l'échelle en parallèle)
+            self._scale_size = QSize(target)
+            _start_scaling(self, self.original_image, self._scale_size, self._scale_generation)
+
+    def _display(self, pixmap: QPixmap):
+        """Affiche une image mise à l'échelle."""
+        self.image_label.setPixmap(pixmap)
+        self._update_opaque()
+
+    def _update_opaque(self):
+        """
+        Déclare le label opaque quand son image, sans transparence, le couvre entièrement.
+
+        Qt ne peint alors ni le fond du label ni les widgets en dessous (autres layers,
+        fond de la fenêtre). Une image avec canal alpha (sprite PNG) reste transparente.
+        """
+        pixmap = self.image_label.pixmap()
+        opaque = (not pixmap.isNull() and not pixmap.hasAlphaChannel() and
+                  pixmap.width() >= self.image_label.width() and
+                  pixmap.height() >= self.image_label.height())
+        self.image_label.setAttribute(Qt.WidgetAttribute.WA_OpaquePaintEvent, opaque)
+
+    def _on_scaled(self, generation: int, image: QImage):
+        """Reçoit un rendu lissé (thread GUI)."""
+        # Ignorer un rendu dépassé (nouvelle image, resize ou effacement entre-temps)
+        if generation != self._scale_generation:
+            return
+        self._display(QPixmap.fromImage(image))
+        self._last_scaled_size = self._scale_size
+        self._last_scaled_smooth = True
+
+    def _rescale_after_resize(self):
+        """Remise à l'échelle rapide regroupée après une rafale de resize."""
+        self._rescale_pending = False
+        self.update_pixmap(fast=True)
 
     def clear_image(self):
         """Efface l'image."""
+        self._scale_generation += 1
+        self._current_path = None
         self.image_label.clear()
         self.image_label.setStyleSheet("background-color: transparent;")
+        self._update_opaque()
 
     def resizeEvent(self, event):
         """Redimensionne l'image quand le widget change de taille."""
         super().resizeEvent(event)
         self.image_label.setGeometry(self.rect())
-        self.update_pixmap()
+        # Agrandi: l'image actuelle ne couvre plus tout le label jusqu'à la remise à l'échelle
+        self._update_opaque()
+        if not self._rescale_pending:
+            self._rescale_pending = True
+            QTimer.singleShot(self.RESIZE_DEBOUNCE_MS, self._rescale_after_resize)
+        # Relancé à chaque resize: le rendu lissé attend la fin du redimensionnement
+        self._finalize_timer.start()
 
 
 class ImageComponent(GUIComponent):
@@ -87,7 +277,7 @@ class ImageComponent(GUIComponent):
 
     def __init__(self, gui: GUI):
         super().__init__(gui)
-        # Dictionnaire des layers : {layer_id: {'widget': widget, 'image_path': path, 'layer': z_order}}
+        # Dictionnaire des layers : {layer_id: {'widget': widget, 'image_path': path, 'layer': z_order, 'attached': bool}}
         self.layers: Dict[int, Dict] = {}
 
     def create_widget(self) -> QWidget:
@@ -113,21 +303,30 @@ class ImageComponent(GUIComponent):
             self.layers[layer] = {
                 'widget': widget,
                 'image_path': image_path,
-                'layer': layer
+                'layer': layer,
+                'attached': False
             }
         else:
             # Réutiliser le widget existant
             widget = self.layers[layer]['widget']
             self.layers[layer]['image_path'] = image_path
 
-        # Mettre à jour l'image
-        widget.set_image(image_path)
+        # Mettre à jour l'image: directement si déjà décodée (préchargement), sinon via le widget
+        # (la clé de cache est repassée au widget: pas de second calcul en cas d'absence)
+        pixmap, entry = find_pixmap(image_path, _decode_bound(widget))
+        if pixmap is not None:
+            widget.set_pixmap(pixmap, image_path)
+        else:
+            widget.set_image(image_path, entry)
 
-        # Ajouter à la fenêtre avec le bon z-order
-        if self.gui.window:
+        # Ajouter à la fenêtre avec le bon z-order, une seule fois par layer:
+        # un changement d'image ne touche ni au parent ni à l'empilement du widget
+        entry = self.layers[layer]
+        if self.gui.window and not entry['attached']:
             # Nom unique pour chaque layer
             component_name = f'image_layer_{layer}'
             self.gui.window.add_component_widget(component_name, widget, z_order=layer)
+            entry['attached'] = True
 
         self.visible = True
 
@@ -169,6 +368,31 @@ class ImageComponent(GUIComponent):
         if image_path is not None:
             self.show(image_path, layer)
 
+    def is_showing(self, image_path: str = '', layer: int = 0, **kwargs) -> bool:
+        """
+        Indique si le layer affiche déjà cette image.
+
+        Args:
+            image_path: Chemin de l'image
+            layer: Layer concerné
+
+        Returns:
+            True si l'image est déjà affichée sur ce layer
+        """
+        entry = self.layers.get(layer)
+        return entry is not None and entry['image_path'] == image_path
+
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Décode en arrière-plan des images qui seront bientôt affichées.
+
+        Args:
+            paths: Chemins des images
+        """
+        bound = _decode_bound(self.gui.window)
+        for image_path in paths:
+            prefetch_pixmap(image_path, bound)
+
     def get_layers(self) -> Dict[int, str]:
         """
         Retourne un dictionnaire des layers actifs.
@@ -0,0 +1,66 @@
+"""
+ImageTasks - Traitements d'images exécutés sur le QThreadPool
+
+Utilisé pour le décodage (pixmap_cache) et la mise à l'échelle lissée (image).
+Le traitement ne manipule que des QImage, utilisables hors du thread GUI;
+son résultat est remis sur le thread GUI à un callback.
+"""
+
+import itertools
+from typing import Callable, Dict, Tuple
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtGui import QImage
+
+
+class _TaskSignals(QObject):
+    """Signaux d'une ImageTask (un QRunnable n'est pas un QObject)."""
+
+    done = pyqtSignal(int, QImage)  # tâche, image produite
+
+
+class ImageTask(QRunnable):
+    """Exécute un traitement produisant une QImage sur un thread du QThreadPool."""
+
+    def __init__(self, task: int, work: Callable[[], QImage]):
+        super().__init__()
+        self.task = task
+        self.work = work
+        # Créé sur le thread GUI, sans parent: l'émission depuis le worker est mise en file
+        self.signals = _TaskSignals()
+
+    def run(self):
+        """Traitement (thread du pool)."""
+        self.signals.done.emit(self.task, self.work())
+
+
+# Tâches en cours: tâche → (signaux, callback)
+# Les signaux sont gardés ici: le QRunnable est détruit par le pool après run()
+_running: Dict[int, Tuple[_TaskSignals, Callable[[QImage], None]]] = {}
+_next_task = itertools.count()
+
+
+def start_image_task(work: Callable[[], QImage], callback: Callable[[QImage], None]) -> None:
+    """
+    Lance un traitement d'image sur le QThreadPool.
+
+    Args:
+        work: Traitement exécuté sur un thread du pool (QImage uniquement)
+        callback: Appelé sur le thread GUI avec l'image produite
+    """
+    task = next(_next_task)
+    runnable = ImageTask(task, work)
+    runnable.signals.done.connect(_on_done)
+    _running[task] = (runnable.signals, callback)
+    QThreadPool.globalInstance().start(runnable)
+
+
+def _on_done(task: int, image: QImage) -> None:
+    """
+    Reçoit le résultat d'une tâche sur le thread GUI et le transmet au callback.
+
+    Args:
+        task: Numéro de la tâche
+        image: Image produite
+    """
+    _, callback = _running.pop(task)
+    callback(image)
@@ -2,7 +2,10 @@
 Music - Composant pour la musique avec système de pistes dans les jeux à choix
 """
 
-from typing import Optional, Dict
+import logging
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, Dict, List, Mapping
 from pathlib import Path
 from PyQt6.QtWidgets import QWidget
 from PyQt6.QtMultimedia import QMediaPlayer, QAudioOutput
@@ -10,9 +13,44 @@ from PyQt6.QtCore import QUrl
 from ..gui import GUIComponent, GUI
 
 
+log = logging.getLogger(__name__)
+
+
+# URLs des fichiers audio trouvés: {chemin: URL}
+# Les fichiers introuvables ne sont pas mémorisés: ajoutés ensuite, ils sont trouvés
+_urls: Dict[str, QUrl] = {}
+
+
+def _to_url(music_path: str) -> Optional[QUrl]:
+    """
+    Convertit un chemin audio en URL locale (mémorisée par chemin si le fichier existe).
+
+    Args:
+        music_path: Chemin vers le fichier audio
+
+    Returns:
+        L'URL du fichier, ou None s'il est introuvable
+    """
+    url = _urls.get(music_path)
+    if url is None:
+        path = Path(music_path)
+        if not path.is_file():
+            return None
+        url = _urls[music_path] = QUrl.fromLocalFile(str(path.absolute()))
+    return url
+
+
+def clear_url_cache() -> None:
+    """Oublie les URLs mémorisées (fichiers audio déplacés ou supprimés)."""
+    _urls.clear()
+
+
 class MusicWidget(QWidget):
     """Widget Qt pour jouer de la musique."""
 
+    # Volume d'une piste neuve ou recyclée
+    DEFAULT_VOLUME = 0.5
+
     def __init__(self):
         super().__init__()
         self.setup_audio()
@@ -25,7 +63,9 @@ class MusicWidget(QWidget):
         self.player.setAudioOutput(self.audio_output)
 
         # Configuration par défaut
-        self.audio_output.setVolume(0.5)  # Volume à 50%
+        self.audio_output.setVolume(self.DEFAULT_VOLUME)  # Volume à 50%
+        # Dernier volume appliqué à la sortie
+        self._volume = self.DEFAULT_VOLUME
 
         # Par défaut, pas de boucle (sera configuré selon le paramètre repeat)
         self.player.setLoops(QMediaPlayer.Loops.Once)
@@ -38,28 +78,49 @@ class MusicWidget(QWidget):
             music_path: Chemin vers le fichier audio
             repeat: Si True, boucle à l'infini. Sinon, joue une seule fois
         """
-        if not Path(music_path).exists():
-            print(f"⚠️  Fichier audio introuvable: {music_path}")
+        url = _to_url(music_path)
+        if url is None:
+            log.warning("Fichier audio introuvable: %s", music_path)
             return
 
-        # Configurer le mode de lecture (boucle ou une fois)
-        if repeat:
-            self.player.setLoops(QMediaPlayer.Loops.Infinite)
-        else:
-            self.player.setLoops(QMediaPlayer.Loops.Once)
+        # Mode de lecture (boucle ou une fois)
+        loops = QMediaPlayer.Loops.Infinite if repeat else QMediaPlayer.Loops.Once
 
-        # Charger et jouer la musique
-        url = QUrl.fromLocalFile(str(Path(music_path).absolute()))
-        self.player.setSource(url)
+        # Déjà en cours de lecture avec le même mode: ne pas recharger le décodeur
+        if (self.player.source() == url and self.player.loops() == loops and
+                self.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState):
+            return
+
+        # Charger et jouer la musique (source déjà chargée si le lecteur a été préparé)
+        self.player.setLoops(loops)
+        if self.player.source() != url:
+            self.player.setSource(url)
         self.player.play()
 
-        repeat_mode = "en boucle" if repeat else "une fois"
-        print(f"🎵 Lecture de la musique ({repeat_mode}): {Path(music_path).name}")
+        # Formaté par le logging seulement si le niveau INFO est actif (--verbose)
+        log.info("Lecture de la musique (%s): %s",
+                 "en boucle" if repeat else "une fois", url.fileName())
 
     def stop_music(self):
         """Arrête la musique."""
         self.player.stop()
 
+    def preload(self, url: QUrl):
+        """
+        Charge un fichier sans le jouer: le backend analyse le conteneur à l'avance.
+
+        Args:
+            url: URL du fichier audio
+        """
+        if self.player.source() != url:
+            self.player.setSource(url)
+
+    def release(self):
+        """Arrête la lecture et libère le fichier pour réutiliser ce lecteur."""
+        self.player.stop()
+        self.player.setSource(QUrl())
+        self.set_volume(self.DEFAULT_VOLUME)
+
     def pause_music(self):
         """Met la musique en pause."""
         self.player.pause()
@@ -75,7 +136,20 @@ class MusicWidget(QWidget):
         Args:
             volume: Volume entre 0.0 et 1.0
         """
-        self.audio_output.setVolume(max(0.0, min(1.0, volume)))
+        volume = 0.0 if volume < 0.0 else 1.0 if volume > 1.0 else volume
+        # Volume inchangé (fondu sur place, volume par défaut): pas d'appel au backend
+        if volume == self._volume:
+            return
+        self._volume = volume
+        self.audio_output.setVolume(volume)
+
+
+@dataclass(slots=True)
+class Track:
+    """Piste audio active."""
+    widget: MusicWidget
+    music_path: str
+    repeat: bool
 
 
 class MusicComponent(GUIComponent):
@@ -86,15 +160,52 @@ class MusicComponent(GUIComponent):
     Piste 0 = musique de fond principale, autres pistes = effets sonores.
     """
 
+    # Nombre maximal de lecteurs gardés en réserve
+    POOL_MAX = 8
+
     def __init__(self, gui: GUI):
         super().__init__(gui)
-        # Dictionnaire des pistes : {track_id: {'widget': widget, 'music_path': path, 'repeat': bool}}
-        self.tracks: Dict[int, Dict] = {}
+        # Dictionnaire des pistes : {track_id: Track}
+        self.tracks: Dict[int, Track] = {}
+        # Lecteurs libérés, réutilisés par les pistes suivantes
+        self._widget_pool: List[MusicWidget] = []
+        # Lecteur dont la source est déjà chargée (prefetch), pas encore attribué à une piste
+        self._preloaded: Optional[MusicWidget] = None
+        # Vue {track_id: music_path} de get_tracks (None = à reconstruire)
+        self._tracks_snapshot: Optional[Mapping[int, str]] = None
 
     def create_widget(self) -> QWidget:
         """Crée le widget Qt pour ce composant."""
         return MusicWidget()
 
+    def _acquire_widget(self) -> MusicWidget:
+        """Récupère un lecteur de la réserve, ou en crée un (initialisation audio coûteuse)."""
+        if self._widget_pool:
+            return self._widget_pool.pop()
+        return self.create_widget()
+
+    def _take_preloaded(self, music_path: str) -> Optional[MusicWidget]:
+        """
+        Récupère le lecteur préparé s'il a chargé ce fichier.
+
+        Args:
+            music_path: Chemin du fichier audio
+
+        Returns:
+            Le lecteur préparé, ou None
+        """
+        widget = self._preloaded
+        if widget is not None and widget.player.source() == _to_url(music_path):
+            self._preloaded = None
+            return widget
+        return None
+
+    def _release_widget(self, widget: MusicWidget) -> None:
+        """Arrête un lecteur et le remet en réserve."""
+        widget.release()
+        if len(self._widget_pool) < self.POOL_MAX:
+            self._widget_pool.append(widget)
+
     def show(self, music_path: str, track: int = 0, repeat: bool = True, **kwargs) -> None:
         """
         Joue de la musique sur une piste spécifique.
@@ -105,25 +216,30 @@ class MusicComponent(GUIComponent):
             repeat: Si True, boucle. Sinon, joue une fois
             **kwargs: Paramètres supplémentaires
         """
+        entry = self.tracks.get(track)
+
         # Si la piste existe déjà avec la même musique et même mode repeat, ne rien faire
-        if track in self.tracks:
-            if (self.tracks[track]['music_path'] == music_path and
-                self.tracks[track]['repeat'] == repeat):
-                return
+        if entry is not None and entry.music_path == music_path and entry.repeat == repeat:
+            return
+
+        self._tracks_snapshot = None
+
+        # Lecteur ayant déjà chargé ce fichier (prefetch)
+        preloaded = self._take_preloaded(music_path)
 
         # Créer ou mettre à jour la piste
-        if track not in self.tracks:
-            widget = self.create_widget()
-            self.tracks[track] = {
-                'widget': widget,
-                'music_path': music_path,
-                'repeat': repeat
-            }
+        if entry is None:
+            widget = preloaded or self._acquire_widget()
+            self.tracks[track] = Track(widget, music_path, repeat)
         else:
-            # Réutiliser le widget existant
-            widget = self.tracks[track]['widget']
-            self.tracks[track]['music_path'] = music_path
-            self.tracks[track]['repeat'] = repeat
+            if preloaded is not None:
+                # Le lecteur préparé remplace celui de la piste
+                self._release_widget(entry.widget)
+                entry.widget = preloaded
+            # Sinon réutiliser le widget existant
+            widget = entry.widget
+            entry.music_path = music_path
+            entry.repeat = repeat
 
         # Jouer la musique avec le bon mode repeat
         widget.play_music(music_path, repeat)
@@ -136,17 +252,23 @@ class MusicComponent(GUIComponent):
 
         Args:
             track: Piste spécifique à arrêter, ou None pour tout arrêter
+                   (y compris le lecteur préparé par prefetch)
         """
+        self._tracks_snapshot = None
         if track is not None:
             # Arrêter une piste spécifique
-            if track in self.tracks:
-                self.tracks[track]['widget'].stop_music()
-                del self.tracks[track]
+            entry = self.tracks.pop(track, None)
+            if entry is not None:
+                self._release_widget(entry.widget)
         else:
             # Arrêter toutes les pistes
-            for track_data in self.tracks.values():
-                track_data['widget'].stop_music()
+            for entry in self.tracks.values():
+                self._release_widget(entry.widget)
             self.tracks.clear()
+            # Le lecteur préparé garde son fichier ouvert: le libérer aussi
+            if self._preloaded is not None:
+                self._release_widget(self._preloaded)
+                self._preloaded = None
 
         # Marquer comme invisible si plus aucune piste
         if not self.tracks:
@@ -173,11 +295,12 @@ class MusicComponent(GUIComponent):
             track: Piste spécifique, ou None pour toutes les pistes
         """
         if track is not None:
-            if track in self.tracks and self.visible:
-                self.tracks[track]['widget'].pause_music()
+            entry = self.tracks.get(track)
+            if entry is not None and self.visible:
+                entry.widget.pause_music()
         else:
-            for track_data in self.tracks.values():
-                track_data['widget'].pause_music()
+            for entry in self.tracks.values():
+                entry.widget.pause_music()
 
     def resume(self, track: Optional[int] = None) -> None:
         """
@@ -187,11 +310,12 @@ class MusicComponent(GUIComponent):
             track: Piste spécifique, ou None pour toutes les pistes
         """
         if track is not None:
-            if track in self.tracks and self.visible:
-                self.tracks[track]['widget'].resume_music()
+            entry = self.tracks.get(track)
+            if entry is not None and self.visible:
+                entry.widget.resume_music()
         else:
-            for track_data in self.tracks.values():
-                track_data['widget'].resume_music()
+            for entry in self.tracks.values():
+                entry.widget.resume_music()
 
     def set_volume(self, volume: float, track: Optional[int] = None) -> None:
         """
@@ -202,17 +326,60 @@ class MusicComponent(GUIComponent):
             track: Piste spécifique, ou None pour toutes les pistes
         """
         if track is not None:
-            if track in self.tracks:
-                self.tracks[track]['widget'].set_volume(volume)
+            entry = self.tracks.get(track)
+            if entry is not None:
+                entry.widget.set_volume(volume)
         else:
-            for track_data in self.tracks.values():
-                track_data['widget'].set_volume(volume)
+            for entry in self.tracks.values():
+                entry.widget.set_volume(volume)
+
+    def is_showing(self, music_path: str = '', track: int = 0, repeat: bool = True, **kwargs) -> bool:
+        """
+        Indique si la piste joue déjà cette musique avec ce mode repeat.
+
+        Args:
+            music_path: Chemin du fichier audio
+            track: Piste concernée
+            repeat: Mode de répétition
+
+        Returns:
+            True si la piste joue déjà cette musique
+        """
+        entry = self.tracks.get(track)
+        return (entry is not None and
+                entry.music_path == music_path and
+                entry.repeat == repeat)
+
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Prépare un fichier audio sur un lecteur de réserve, sans le jouer.
+
+        Un seul lecteur est préparé: le premier fichier qui n'est pas déjà joué.
+
+        Args:
+            paths: Chemins des fichiers audio
+        """
+        playing = {entry.music_path for entry in self.tracks.values()}
+        for music_path in paths:
+            if music_path in playing:
+                continue
+            url = _to_url(music_path)
+            if url is None:
+                continue
+            if self._preloaded is None:
+                self._preloaded = self._acquire_widget()
+            self._preloaded.preload(url)
+            return
 
-    def get_tracks(self) -> Dict[int, str]:
+    def get_tracks(self) -> Mapping[int, str]:
         """
         Retourne un dictionnaire des pistes actives.
 
         Returns:
-            Dict[track_id, music_path]
+            Vue en lecture seule {track_id: music_path}, partagée tant que les pistes ne changent pas
         """
-        return {track_id: data['music_path'] for track_id, data in self.tracks.items()}
+        if self._tracks_snapshot is None:
+            self._tracks_snapshot = MappingProxyType(
+                {track_id: entry.music_path for track_id, entry in self.tracks.items()}
+            )
+        return self._tracks_snapshot
@@ -4,7 +4,7 @@ PauseMenu - Menu de pause (Continuer/Sauvegarder/Charger/Quitter)
 
 from typing import Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, QEvent, pyqtSignal, pyqtSlot
 from ..gui import GUIComponent, GUI
 from ...config import (
     FONT_FAMILY, FONT_SIZE_MENU, FONT_WEIGHT_MENU,
@@ -13,33 +13,51 @@ from ...config import (
 )
 
 
+# Feuilles de style construites une fois, à l'import du module
+# Container du menu et ses boutons
+_MENU_BOX_QSS = f"""
+    QWidget {{
+        background-color: rgba(200, 200, 205, 255);
+        border: none;
+    }}
+    #PauseBox QPushButton {{
+        background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {MENU_BOX_OPACITY});
+        color: {TEXT_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_MENU}px;
+        font-weight: {FONT_WEIGHT_MENU};
+        border: none;
+        padding: 15px 35px;
+        margin: 6px 0px;
+    }}
+    #PauseBox QPushButton:hover {{
+        background-color: rgba(255, 255, 255, 255);
+    }}
+    #PauseBox QPushButton:pressed {{
+        background-color: rgba(220, 220, 225, 255);
+    }}
+"""
+
+# Titre du menu
+_TITLE_QSS = f"""
+    QLabel {{
+        color: {TEXT_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: 28px;
+        font-weight: bold;
+        padding-bottom: 25px;
+        background-color: transparent;
+    }}
+"""
+
+
 class PauseButton(QPushButton):
     """Bouton de menu pause stylisé."""
 
-    def __init__(self, text: str):
+    def __init__(self, text: str, action: str):
         super().__init__(text)
-        self.setup_style()
-
-    def setup_style(self):
-        """Configure le style du bouton."""
-        self.setStyleSheet(f"""
-            QPushButton {{
-                background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {MENU_BOX_OPACITY});
-                color: {TEXT_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_MENU}px;
-                font-weight: {FONT_WEIGHT_MENU};
-                border: none;
-                padding: 15px 35px;
-                margin: 6px 0px;
-            }}
-            QPushButton:hover {{
-                background-color: rgba(255, 255, 255, 255);
-            }}
-            QPushButton:pressed {{
-                background-color: rgba(220, 220, 225, 255);
-            }}
-        """)
+        self.action = action
+        # Style porté par le container (#PauseBox): une seule feuille pour tous les boutons
         self.setCursor(Qt.CursorShape.PointingHandCursor)
 
 
@@ -57,13 +75,10 @@ class PauseMenuWidget(QWidget):
         self.setStyleSheet("background-color: rgba(0, 0, 0, 100);")  # Overlay semi-transparent
 
         # Container centré
+        # Style des boutons inclus ici: parsé une fois pour tout le menu
         self.menu_container = QWidget(self)
-        self.menu_container.setStyleSheet("""
-            QWidget {
-                background-color: rgba(200, 200, 205, 255);
-                border: none;
-            }
-        """)
+        self.menu_container.setObjectName("PauseBox")
+        self.menu_container.setStyleSheet(_MENU_BOX_QSS)
 
         layout = QVBoxLayout(self.menu_container)
         layout.setContentsMargins(50, 50, 50, 50)
@@ -71,36 +86,33 @@ class PauseMenuWidget(QWidget):
 
         # Titre
         title_label = QLabel("PAUSE")
+        title_label.setTextFormat(Qt.TextFormat.PlainText)
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: 28px;
-                font-weight: bold;
-                padding-bottom: 25px;
-                background-color: transparent;
-            }}
-        """)
+        title_label.setStyleSheet(_TITLE_QSS)
         layout.addWidget(title_label)
 
-        # Boutons
-        continue_button = PauseButton("Continuer")
-        continue_button.clicked.connect(lambda: self.action_selected.emit('continue'))
+        # Boutons: un seul slot pour tous, l'action est portée par le bouton
+        continue_button = PauseButton("Continuer", 'continue')
+        continue_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(continue_button)
 
-        save_button = PauseButton("Sauvegarder")
-        save_button.clicked.connect(lambda: self.action_selected.emit('save'))
+        save_button = PauseButton("Sauvegarder", 'save')
+        save_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(save_button)
 
-        load_button = PauseButton("Charger")
-        load_button.clicked.connect(lambda: self.action_selected.emit('load'))
+        load_button = PauseButton("Charger", 'load')
+        load_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(load_button)
 
-        quit_button = PauseButton("Quitter")
-        quit_button.clicked.connect(lambda: self.action_selected.emit('quit'))
+        quit_button = PauseButton("Quitter", 'quit')
+        quit_button.clicked.connect(self._on_button_clicked)
         layout.addWidget(quit_button)
 
+    @pyqtSlot()
+    def _on_button_clicked(self):
+        """Émet l'action du bouton cliqué."""
+        self.action_selected.emit(self.sender().action)
+
     def resizeEvent(self, event):
         """Repositionne le container au centre."""
         super().resizeEvent(event)
@@ -113,6 +125,13 @@ class PauseMenuWidget(QWidget):
 
         self.menu_container.setGeometry(x, y, container_width, container_height)
 
+    def event(self, event):
+        """Garde ESC pour le menu: le raccourci ESC (ouvrir la pause) ne doit pas se déclencher."""
+        if event.type() == QEvent.Type.ShortcutOverride and event.key() == Qt.Key.Key_Escape:
+            event.accept()
+            return True
+        return super().event(event)
+
     def keyPressEvent(self, event):
         """Détecte ESC pour continuer."""
         if event.key() == Qt.Key.Key_Escape:
@@ -162,12 +181,13 @@ class PauseMenuComponent(GUIComponent):
 
     def hide(self) -> None:
         """Cache le composant."""
+        # Le widget est gardé (caché) pour le prochain affichage
         if self.gui.window and self.widget:
-            self.gui.window.remove_component_widget('pause_menu')
+            self.gui.window.detach_component_widget('pause_menu')
 
         self.visible = False
-        self.widget = None
         self._selected_action = None
+        self._stop_waiting()
 
     def update(self, **kwargs) -> None:
         """Met à jour le composant."""
@@ -176,17 +196,15 @@ class PauseMenuComponent(GUIComponent):
     def _on_action_selected(self, action: str):
         """Appelé quand l'utilisateur sélectionne une action."""
         self._selected_action = action
+        self._stop_waiting()
 
     def _wait_for_action(self) -> str:
         """Attend que l'utilisateur sélectionne une action."""
-        import time
-
         self._selected_action = None
         self._waiting = True
 
-        while self._selected_action is None and self.visible:
-            self.gui.process_events()
-            time.sleep(0.01)
+        # Attente événementielle: réveillée par une action ou hide()
+        self._wait()
 
         self._waiting = False
         result = self._selected_action or 'continue'
@@ -0,0 +1,263 @@
+"""
+PixmapCache - Cache des images décodées partagé par les composants d'image
+
+Évite de relire et redécoder une image (PNG/JPEG) à chaque affichage:
+les QPixmap décodées sont gardées dans le QPixmapCache de Qt, indexées par
+chemin absolu + date de modification (un fichier modifié est rechargé
+après GUI.reload_assets(), qui oublie les dates mémorisées).
+
+Le décodage peut aussi se faire hors du thread GUI (request_pixmap):
+une ImageTask (image_tasks) produit une QImage (utilisable hors du thread GUI, contrairement
+à QPixmap), convertie en QPixmap à la réception sur le thread GUI.
+
+Avec une taille d'affichage maximale (bound), l'image est réduite pendant
+le décodage (QImageReader.setScaledSize: le décodeur JPEG ne calcule que les
+pixels utiles) au lieu d'être décodée en pleine résolution puis réduite.
+"""
+
+import os
+import weakref
+from functools import lru_cache, partial
+from typing import Callable, Dict, List, Optional, Tuple
+from PyQt6 import sip
+from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+from .image_tasks import start_image_task
+
+# Taille maximale du cache (en Ko): ~256 Mo d'images décodées
+CACHE_LIMIT_KB = 256 * 1024
+
+QPixmapCache.setCacheLimit(CACHE_LIMIT_KB)
+
+# Décodages en cours: clé → callbacks en attente (méthode, chemin demandé)
+_pending: Dict[str, List[Tuple[weakref.WeakMethod, str]]] = {}
+
+
+@lru_cache(maxsize=512)
+def path_exists(image_path: str) -> bool:
+    """
+    Indique si un fichier image existe (résultat mémorisé par chemin).
+
+    Évite un stat() à chaque affichage d'une image déjà vue.
+    Voir clear_cache() pour oublier les résultats.
+
+    Args:
+        image_path: Chemin vers l'image
+
+    Returns:
+        True si le chemin désigne un fichier
+    """
+    return os.path.isfile(image_path)
+
+
+@lru_cache(maxsize=512)
+def _file_stamp(image_path: str) -> Optional[Tuple[str, float]]:
+    """
+    Résout le chemin absolu et la date de modification d'une image (mémorisés par chemin).
+
+    Évite un stat() à chaque recherche dans le cache d'une image déjà vue.
+    Voir clear_cache() pour oublier les résultats.
+
+    Args:
+        image_path: Chemin vers l'image
+
+    Returns:
+        (chemin absolu, date de modification) ou None si le fichier est introuvable
+    """
+    abs_path = os.path.abspath(image_path)
+    try:
+        return abs_path, os.path.getmtime(abs_path)
+    except OSError:
+        return None
+
+
+def clear_cache() -> None:
+    """Oublie les images décodées, les existences et les dates de fichiers mémorisées."""
+    path_exists.cache_clear()
+    _file_stamp.cache_clear()
+    QPixmapCache.clear()
+
+
+def _cache_key(image_path: str, bound: Optional[QSize]) -> Optional[Tuple[str, str]]:
+    """
+    Calcule la clé de cache d'une image.
+
+    Args:
+        image_path: Chemin vers l'image
+        bound: Taille d'affichage maximale (None = pleine résolution)
+
+    Returns:
+        (chemin absolu, clé) ou None si le fichier est introuvable
+    """
+    stamp = _file_stamp(image_path)
+    if stamp is None:
+        return None
+    abs_path, mtime = stamp
+    size = f"{bound.width()}x{bound.height()}" if bound is not None else "full"
+    return abs_path, f"{abs_path}:{mtime}:{size}"
+
+
+def _decode_image(abs_path: str, bound: Optional[QSize]) -> QImage:
+    """
+    Décode une image, réduite si possible dès le décodage.
+
+    Utilisable hors du thread GUI (QImage uniquement).
+
+    Args:
+        abs_path: Chemin absolu de l'image
+        bound: Taille que l'image doit couvrir à l'affichage (None = pleine résolution)
+
+    Returns:
+        L'image décodée (nulle si illisible)
+    """
+    reader = QImageReader(abs_path)
+    if bound is not None:
+        source = reader.size()
+        if source.isValid():
+            # Plus petite taille couvrant encore la zone d'affichage (jamais agrandie)
+            target = source.scaled(bound, Qt.AspectRatioMode.KeepAspectRatioByExpanding)
+            if target.width() < source.width():
+                reader.setScaledSize(target)
+    return reader.read()
+
+
+def load_pixmap(image_path: str, bound: Optional[QSize] = None) -> QPixmap:
+    """
+    Charge une image en passant par le cache (décodage synchrone).
+
+    Args:
+        image_path: Chemin vers l'image
+        bound: Taille que l'image doit couvrir à l'affichage (None = pleine résolution)
+
+    Returns:
+        La QPixmap décodée (partagée implicitement), ou une QPixmap nulle
+        si le fichier est introuvable ou illisible
+    """
+    entry = _cache_key(image_path, bound)
+    if entry is None:
+        return QPixmap()
+    abs_path, key = entry
+
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap.fromImage(_decode_image(abs_path, bound))
+        if not pixmap.isNull():
+            QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+def find_pixmap(image_path: str, bound: Optional[QSize] = None
+                ) -> Tuple[Optional[QPixmap], Optional[Tuple[str, str]]]:
+    """
+    Cherche une image déjà décodée, sans jamais la décoder.
+
+    Args:
+        image_path: Chemin vers l'image
+        bound: Taille que l'image doit couvrir à l'affichage (None = pleine résolution)
+
+    Returns:
+        (QPixmap si elle est dans le cache sinon None, clé de cache ou None si
+        le fichier est introuvable). La clé peut être repassée à request_pixmap()
+        pour ne pas la recalculer en cas d'absence du cache.
+    """
+    entry = _cache_key(image_path, bound)
+    if entry is None:
+        return None, None
+    return QPixmapCache.find(entry[1]), entry
+
+
+def _start_decode(abs_path: str, key: str, bound: Optional[QSize]) -> None:
+    """
+    Lance le décodage d'une image sur le QThreadPool (résultat reçu par _on_loaded).
+
+    Args:
+        abs_path: Chemin absolu de l'image
+        key: Clé de cache de l'image
+        bound: Taille que l'image doit couvrir à l'affichage (None = pleine résolution)
+    """
+    start_image_task(partial(_decode_image, abs_path, bound), partial(_on_loaded, key))
+
+
+def _on_loaded(key: str, image: QImage) -> None:
+    """
+    Reçoit une image décodée sur le thread GUI et notifie les demandeurs.
+
+    Args:
+        key: Clé de cache de l'image
+        image: Image décodée (nulle si illisible)
+    """
+    callbacks = _pending.pop(key, [])
+
+    pixmap = QPixmap.fromImage(image) if not image.isNull() else QPixmap()
+    if not pixmap.isNull():
+        QPixmapCache.insert(key, pixmap)
+
+    for ref, image_path in callbacks:
+        callback = ref()
+        # Le widget a pu être détruit pendant le décodage
+        if callback is None or sip.isdeleted(callback.__self__):
+            continue
+        callback(image_path, pixmap)
+
+
+def request_pixmap(image_path: str, callback: Callable[[str, QPixmap], None],
+                   bound: Optional[QSize] = None,
+                   entry: Optional[Tuple[str, str]] = None) -> Optional[QPixmap]:
+    """
+    Récupère une image du cache, ou lance son décodage en arrière-plan.
+
+    Args:
+        image_path: Chemin vers l'image
+        callback: Méthode d'un QObject appelée sur le thread GUI avec
+                  (image_path, QPixmap nulle si illisible) une fois l'image décodée.
+                  Tenue par référence faible.
+        bound: Taille que l'image doit couvrir à l'affichage (None = pleine résolution)
+        entry: Clé de cache déjà obtenue par find_pixmap() pour ces image_path et bound
+               (None = la calculer)
+
+    Returns:
+        La QPixmap si elle est déjà disponible (nulle si le fichier est introuvable),
+        ou None si le décodage est en cours (le callback sera appelé)
+    """
+    if entry is None:
+        entry = _cache_key(image_path, bound)
+    if entry is None:
+        return QPixmap()
+    abs_path, key = entry
+
+    pixmap = QPixmapCache.find(key)
+    if pixmap is not None:
+        return pixmap
+
+    # Regrouper les demandes pour une même image en un seul décodage
+    if key in _pending:
+        _pending[key].append((weakref.WeakMethod(callback), image_path))
+        return None
+
+    _pending[key] = [(weakref.WeakMethod(callback), image_path)]
+    _start_decode(abs_path, key, bound)
+    return None
+
+
+def prefetch_pixmap(image_path: str, bound: Optional[QSize] = None) -> None:
+    """
+    Lance le décodage en arrière-plan d'une image qui sera bientôt affichée.
+
+    L'image décodée est déposée dans le cache: le request_pixmap() suivant
+    avec le même bound la trouve directement.
+
+    Args:
+        image_path: Chemin vers l'image
+        bound: Taille que l'image doit couvrir à l'affichage (None = pleine résolution)
+    """
+    entry = _cache_key(image_path, bound)
+    if entry is None:
+        return
+    abs_path, key = entry
+
+    # Déjà décodée ou en cours de décodage
+    if key in _pending or QPixmapCache.find(key) is not None:
+        return
+
+    _pending[key] = []
+    _start_decode(abs_path, key, bound)
@@ -4,7 +4,7 @@ TextDialog - Composant d'affichage de texte pour jeux à choix
 
 from typing import Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal
 from ..gui import GUIComponent, GUI
 from ...config import (
     FONT_FAMILY, FONT_SIZE_TEXT, FONT_SIZE_SPEAKER,
@@ -15,6 +15,51 @@ from ...config import (
 )
 
 
+# Feuilles de style construites une fois, à l'import du module
+# Boîte de dialogue (effet glassmorphism)
+_CONTENT_BOX_QSS = f"""
+    QWidget {{
+        background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {TEXT_BOX_OPACITY});
+        border: 1px solid rgba(255, 255, 255, {BORDER_OPACITY});
+        border-radius: {BORDER_RADIUS}px;
+    }}
+"""
+
+# Nom du personnage
+_SPEAKER_QSS = f"""
+    QLabel {{
+        color: {SPEAKER_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_SPEAKER}px;
+        font-weight: {FONT_WEIGHT_SPEAKER};
+        background-color: transparent;
+        border: none;
+    }}
+"""
+
+# Texte du dialogue
+_TEXT_QSS = f"""
+    QLabel {{
+        color: {TEXT_COLOR};
+        font-family: {FONT_FAMILY};
+        font-size: {FONT_SIZE_TEXT}px;
+        font-weight: {FONT_WEIGHT_TEXT};
+        background-color: transparent;
+        border: none;
+    }}
+"""
+
+# Indicateur "continuer"
+_CONTINUE_QSS = """
+    QLabel {
+        color: #666666;
+        font-size: 14px;
+        background-color: transparent;
+        border: none;
+    }
+"""
+
+
 class TextDialogWidget(QWidget):
     """Widget Qt pour afficher un dialogue de texte."""
 
@@ -31,64 +76,50 @@ class TextDialogWidget(QWidget):
 
         # Box avec effet glassmorphism (utilise config)
         self.content_box = QWidget(self)
-        self.content_box.setStyleSheet(f"""
-            QWidget {{
-                background-color: rgba({BOX_BACKGROUND_R}, {BOX_BACKGROUND_G}, {BOX_BACKGROUND_B}, {TEXT_BOX_OPACITY});
-                border: 1px solid rgba(255, 255, 255, {BORDER_OPACITY});
-                border-radius: {BORDER_RADIUS}px;
-            }}
-        """)
+        self.content_box.setStyleSheet(_CONTENT_BOX_QSS)
 
         # Label pour le speaker (utilise config)
         self.speaker_label = QLabel(self.content_box)
-        self.speaker_label.setStyleSheet(f"""
-            QLabel {{
-                color: {SPEAKER_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_SPEAKER}px;
-                font-weight: {FONT_WEIGHT_SPEAKER};
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+        self.speaker_label.setTextFormat(Qt.TextFormat.PlainText)  # Pas d'analyse HTML à chaque setText
+        self.speaker_label.setStyleSheet(_SPEAKER_QSS)
         self.speaker_label.hide()
 
         # Label pour le texte (utilise config)
         self.text_label = QLabel(self.content_box)
+        self.text_label.setTextFormat(Qt.TextFormat.PlainText)
         self.text_label.setWordWrap(True)
         self.text_label.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-        self.text_label.setStyleSheet(f"""
-            QLabel {{
-                color: {TEXT_COLOR};
-                font-family: {FONT_FAMILY};
-                font-size: {FONT_SIZE_TEXT}px;
-                font-weight: {FONT_WEIGHT_TEXT};
-                background-color: transparent;
-                border: none;
-            }}
-        """)
+        self.text_label.setStyleSheet(_TEXT_QSS)
 
         # Indicateur "continuer"
         self.continue_label = QLabel("▼", self.content_box)
         self.continue_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.continue_label.setStyleSheet("""
-            QLabel {
-                color: #666666;
-                font-size: 14px;
-                background-color: transparent;
-                border: none;
-            }
-        """)
+        self.continue_label.setStyleSheet(_CONTINUE_QSS)
 
         # Gérer les clics
         self.setFocusPolicy(Qt.FocusPolicy.StrongFocus)
 
+        # Dernière disposition appliquée: (largeur, hauteur, speaker caché)
+        self._last_layout = None
+        # Dernier contenu affiché: (texte, speaker)
+        self._last_content = None
+
     def resizeEvent(self, event):
         """Repositionne les éléments quand le widget est redimensionné."""
         super().resizeEvent(event)
+        self._layout_content()
+
+    def _layout_content(self):
+        """Positionne la box et ses labels (rien à faire si la disposition n'a pas changé)."""
         width = self.width()
         height = self.height()
 
+        # La disposition ne dépend que de la taille et de la présence du speaker
+        layout_key = (width, height, self.speaker_label.isHidden())
+        if layout_key == self._last_layout:
+            return
+        self._last_layout = layout_key
+
         # Positionner la box (utilise config pour les marges)
         self.content_box.setGeometry(TEXT_BOX_MARGIN, TEXT_BOX_MARGIN,
                                       width - 2*TEXT_BOX_MARGIN, height - 2*TEXT_BOX_MARGIN)
@@ -115,6 +146,12 @@ class TextDialogWidget(QWidget):
 
     def set_content(self, text: str, speaker: Optional[str] = None):
         """Définit le contenu du dialogue."""
+        # Même contenu (update() sans changement, texte réaffiché): labels déjà à jour
+        content = (text, speaker)
+        if content == self._last_content:
+            return
+        self._last_content = content
+
         self.text_label.setText(text)
 
         if speaker:
@@ -123,8 +160,8 @@ class TextDialogWidget(QWidget):
         else:
             self.speaker_label.hide()
 
-        # Déclencher un resize pour repositionner
-        self.resizeEvent(None)
+        # Repositionner si l'apparition du speaker a changé la disposition
+        self._layout_content()
 
     def mousePressEvent(self, event):
         """Détecte les clics."""
@@ -186,13 +223,14 @@ class TextDialogComponent(GUIComponent):
 
     def hide(self) -> None:
         """Cache le composant."""
+        # Le widget est gardé (caché) pour le prochain affichage
         if self.gui.window and self.widget:
-            self.gui.window.remove_component_widget('text_dialog')
+            self.gui.window.detach_component_widget('text_dialog')
 
         self.visible = False
-        self.widget = None
         self.text = ""
         self.speaker = None
+        self._stop_waiting()
 
     def update(self, text: Optional[str] = None, speaker: Optional[str] = None, **kwargs) -> None:
         """
@@ -214,22 +252,15 @@ class TextDialogComponent(GUIComponent):
     def _on_continue(self):
         """Appelé quand l'utilisateur clique pour continuer."""
         self._continue_clicked = True
+        self._stop_waiting()
 
     def _wait_for_continue(self):
         """Attend que l'utilisateur clique pour continuer."""
-        import time
-
         self._continue_clicked = False
         self._waiting = True
 
-        # Boucle d'attente avec process events et petit délai
-        while not self._continue_clicked and self.visible:
-            # Vérifier si un retour en arrière est demandé
-            if self.gui.engine and self.gui.engine._go_back_requested:
-                self._waiting = False
-                return
-
-            self.gui.process_events()
-            time.sleep(0.01)
+        # Attente événementielle: réveillée par un clic, hide() ou un retour en arrière ou au menu
+        if not (self.gui.engine and self.gui.engine.interaction_interrupted):
+            self._wait(interruptible=True)
 
         self._waiting = False
@@ -4,14 +4,19 @@ GUI - Moteur d'interface graphique PyQt6 pour le runtime
 Gère une fenêtre de jeu et des composants visuels pouvant être utilisés par les managers.
 """
 
-from typing import Any, Dict, Optional, List, Type
+import logging
+from typing import Any, Dict, Optional, List, Tuple, Type
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from PyQt6.QtWidgets import QApplication, QMainWindow, QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt, QEvent, QObject
+from PyQt6.QtCore import Qt, QEventLoop, QSize, QThreadPool, QTimer
 from PyQt6.QtGui import QPalette, QColor
 import sys
 
 
+log = logging.getLogger(__name__)
+
+
 class GUIComponent(ABC):
     """
     Classe de base pour tous les composants GUI.
@@ -23,6 +28,7 @@ class GUIComponent(ABC):
         self.gui = gui
         self.visible = False
         self.widget: Optional[QWidget] = None
+        self._wait_loop: Optional[QEventLoop] = None
 
     @abstractmethod
     def create_widget(self) -> QWidget:
@@ -44,29 +50,111 @@ class GUIComponent(ABC):
         """Met à jour le composant."""
         pass
 
+    def _wait(self, interruptible: bool = False) -> None:
+        """
+        Bloque jusqu'à _stop_waiting(), sans polling.
 
-class KeyEventFilter(QObject):
-    """Filtre d'événements pour capturer les touches clavier et molette globalement."""
+        Une QEventLoop imbriquée traite les événements Qt pendant l'attente
+        et ne se réveille que lorsqu'un événement arrive.
 
-    def __init__(self, key_handler, scroll_callback=None):
-        super().__init__()
-        self.key_handler = key_handler
-        self.scroll_callback = scroll_callback
+        Args:
+            interruptible: Si True, un retour en arrière ou au menu (GUI.interrupt_waits)
+                           termine aussi l'attente
+        """
+        loop = QEventLoop()
+        # Attentes imbriquées possibles: restaurer la précédente à la sortie
+        previous = self._wait_loop
+        self._wait_loop = loop
+        if interruptible:
+            self.gui._interruptible_loops.append(loop)
+        try:
+            loop.exec()
+        finally:
+            self._wait_loop = previous
+            if interruptible:
+                self.gui._interruptible_loops.remove(loop)
+
+    def _stop_waiting(self) -> None:
+        """Termine l'attente en cours (appelé depuis un slot ou hide())."""
+        if self._wait_loop is not None:
+            self._wait_loop.quit()
+
+    def is_showing(self, **kwargs) -> bool:
+        """
+        Indique si le composant affiche déjà exactement ces paramètres.
+
+        Permet d'éviter un show() ou un update() redondant. Par défaut: toujours False.
+
+        Args:
+            **kwargs: Mêmes paramètres que show()
+
+        Returns:
+            True si show(**kwargs) ne changerait rien
+        """
+        return False
+
+    def prefetch(self, paths: List[str]) -> None:
+        """
+        Prépare des assets avant leur affichage (optionnel).
 
-    def eventFilter(self, obj, event):
-        """Filtre les événements clavier et molette."""
-        if event.type() == QEvent.Type.KeyPress:
-            if self.key_handler:
-                handled = self.key_handler.handle_key_press(event.key())
-                if handled:
-                    return True  # Bloquer la propagation
-        elif event.type() == QEvent.Type.Wheel:
-            if self.scroll_callback:
-                # Détecter scroll vers le haut (angleDelta().y() > 0)
-                if event.angleDelta().y() > 0:
-                    self.scroll_callback()
-                    return True  # Bloquer la propagation
-        return False  # Laisser passer l'événement
+        Par défaut: rien à préparer.
+
+        Args:
+            paths: Chemins des assets à préparer
+        """
+        pass
+
+
+@lru_cache(maxsize=1)
+def _neutral_palette() -> QPalette:
+    """
+    Palette neutre grise de la fenêtre (construite une fois, partagée entre fenêtres).
+
+    Returns:
+        La palette du thème
+    """
+    palette = QPalette()
+    palette.setColor(QPalette.ColorRole.Window, QColor(180, 180, 185))
+    palette.setColor(QPalette.ColorRole.WindowText, QColor(30, 30, 30))
+    palette.setColor(QPalette.ColorRole.Base, QColor(240, 240, 245))
+    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(220, 220, 225))
+    palette.setColor(QPalette.ColorRole.Text, QColor(30, 30, 30))
+    palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 245))
+    palette.setColor(QPalette.ColorRole.ButtonText, QColor(30, 30, 30))
+    return palette
+
+
+# ==================== Positionnement des composants ====================
+
+def _full_window(width: int, height: int) -> Tuple[int, int, int, int]:
+    """Occupe toute la fenêtre."""
+    return 0, 0, width, height
+
+
+# Boîte de dialogue: part de la hauteur de la fenêtre, plafonnée
+_DIALOG_HEIGHT_RATIO = 0.45
+_DIALOG_MAX_HEIGHT = 400
+
+# Portrait (largeur augmentée pour éviter de couper les personnages) et marges
+_PORTRAIT_WIDTH = 400
+_PORTRAIT_HEIGHT = 350
+_PORTRAIT_RIGHT_MARGIN = 20
+_PORTRAIT_BOTTOM_MARGIN = 50
+
+# Décalages depuis le coin bas-droit, calculés une fois
+_PORTRAIT_X_OFFSET = _PORTRAIT_WIDTH + _PORTRAIT_RIGHT_MARGIN
+_PORTRAIT_Y_OFFSET = _PORTRAIT_HEIGHT + _PORTRAIT_BOTTOM_MARGIN
+
+
+def _bottom_dialog(width: int, height: int) -> Tuple[int, int, int, int]:
+    """Boîte fixée en bas, toute la largeur, hauteur adaptative."""
+    dialog_height = min(_DIALOG_MAX_HEIGHT, int(height * _DIALOG_HEIGHT_RATIO))
+    return 0, height - dialog_height, width, dialog_height
+
+
+def _right_portrait(width: int, height: int) -> Tuple[int, int, int, int]:
+    """Portrait à droite, légèrement au-dessus du bas de la fenêtre."""
+    return width - _PORTRAIT_X_OFFSET, height - _PORTRAIT_Y_OFFSET, _PORTRAIT_WIDTH, _PORTRAIT_HEIGHT
 
 
 class GameWindow(QMainWindow):
@@ -76,7 +164,35 @@ class GameWindow(QMainWindow):
     Affiche les composants GUI dans une interface de type visual novel.
     """
 
-    def __init__(self, key_handler=None):
+    # Délai (ms) de regroupement des resize: un seul repositionnement par frame
+    RESIZE_DEBOUNCE_MS = 16
+
+    # Niveaux de superposition (à égalité, le dernier ajouté passe devant)
+    Z_IMAGES = 0
+    Z_TOP = 3
+    _Z_LEVELS = {
+        # Portrait au-dessus des images mais en dessous des dialogues
+        'character_portrait': 1,
+        'text_dialog': 2,
+        'choice_dialog': 2,
+        'game_menu': Z_TOP,
+        'pause_menu': Z_TOP,
+    }
+
+    # Géométrie (x, y, largeur, hauteur) de chaque composant selon la taille de la fenêtre
+    _POSITIONERS = {
+        # Texte fixé en bas, hauteur adaptative
+        'text_dialog': _bottom_dialog,
+        # Choix centrés
+        'choice_dialog': _full_window,
+        # Portrait du personnage sur le côté droit, partiellement au-dessus de la boîte de dialogue
+        'character_portrait': _right_portrait,
+        # Menus en plein écran
+        'game_menu': _full_window,
+        'pause_menu': _full_window,
+    }
+
+    def __init__(self, key_handler=None, scroll_callback=None):
         super().__init__()
         self.setWindowTitle("Choice Game Engine")
         self.setMinimumSize(1024, 768)
@@ -91,26 +207,36 @@ class GameWindow(QMainWindow):
 
         # Container pour les composants avec leurs positions
         self.component_widgets: Dict[str, QWidget] = {}
+        # Clé de superposition des widgets affichés (voir _z_key)
+        self._z_keys: Dict[str, Tuple[int, int]] = {}
+
+        # Repositionnement des composants, une fois la rafale de resize passée
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._apply_positions)
 
-        # KeyHandler pour gérer les touches
+        # KeyHandler pour gérer les touches (raccourcis attachés par GUI.initialize)
         self.key_handler = key_handler
+        # Appelé sur un scroll vers le haut (retour en arrière)
+        self.scroll_callback = scroll_callback
 
-        # Installer un filtre d'événements global pour capturer toutes les touches
-        if key_handler:
-            self.event_filter = KeyEventFilter(key_handler)
-            self.installEventFilter(self.event_filter)
+    def wheelEvent(self, event):
+        """
+        Détecte le scroll vers le haut.
+
+        Les widgets des composants ignorent la molette: l'événement remonte
+        jusqu'à la fenêtre, sans filtre Python sur tous les événements de l'application.
+        """
+        if self.scroll_callback and event.angleDelta().y() > 0:
+            self.scroll_callback()
+            event.accept()
+            return
+        super().wheelEvent(event)
 
     def setup_dark_theme(self):
         """Configure un thème neutre gris pour le jeu."""
-        palette = QPalette()
-        palette.setColor(QPalette.ColorRole.Window, QColor(180, 180, 185))
-        palette.setColor(QPalette.ColorRole.WindowText, QColor(30, 30, 30))
-        palette.setColor(QPalette.ColorRole.Base, QColor(240, 240, 245))
-        palette.setColor(QPalette.ColorRole.AlternateBase, QColor(220, 220, 225))
-        palette.setColor(QPalette.ColorRole.Text, QColor(30, 30, 30))
-        palette.setColor(QPalette.ColorRole.Button, QColor(240, 240, 245))
-        palette.setColor(QPalette.ColorRole.ButtonText, QColor(30, 30, 30))
-        self.setPalette(palette)
+        self.setPalette(_neutral_palette())
 
     def add_component_widget(self, name: str, widget: QWidget, z_order: int = 0):
         """
@@ -121,80 +247,82 @@ class GameWindow(QMainWindow):
             widget: Widget Qt à ajouter
             z_order: Ordre de superposition (plus élevé = au premier plan)
         """
-        if name in self.component_widgets:
+        # Remplacer un autre widget sous ce nom. Un widget réutilisé reste en place:
+        # le retirer programmerait sa destruction (deleteLater) alors qu'il est encore utilisé
+        existing = self.component_widgets.get(name)
+        if existing is not None and existing is not widget:
             self.remove_component_widget(name)
 
         self.component_widgets[name] = widget
-        widget.setParent(self.central_widget)
+        # Un widget déjà enfant de la fenêtre (réaffiché après un hide) garde son parent
+        if widget.parentWidget() is not self.central_widget:
+            widget.setParent(self.central_widget)
 
         # Positionner et dimensionner le widget selon son type
         self._position_widget(name, widget)
 
-        # Gérer le z-order
-        if name.startswith('image_layer_'):
-            # Pour les layers d'image, utiliser le z_order fourni
-            # Z-order négatif = arrière-plan, 0 = normal, positif = avant-plan
-            if z_order < 0:
-                widget.lower()
-                # Mettre derrière tous les widgets existants
-                for existing_widget in self.component_widgets.values():
-                    if existing_widget != widget:
-                        widget.stackUnder(existing_widget)
-            else:
-                # Empiler selon le z_order
-                widget.raise_()
-                # Trouver le widget juste au-dessus dans le z-order
-                for comp_name, existing_widget in self.component_widgets.items():
-                    if comp_name.startswith('image_layer_'):
-                        # Extraire le z_order du nom
-                        try:
-                            existing_z = int(comp_name.split('_')[-1])
-                            if existing_z > z_order:
-                                widget.stackUnder(existing_widget)
-                        except (ValueError, IndexError):
-                            pass
-        elif name == 'character_portrait':
+        # Gérer le z-order: un seul restack, juste sous le plus bas des widgets
+        # qui doivent rester au-dessus (sinon au premier plan)
+        z_key = self._z_key(name, z_order)
+        self._z_keys[name] = z_key
+        above_key = None
+        above_widget = None
+        for other_name, other_key in self._z_keys.items():
+            if other_key > z_key and (above_key is None or other_key < above_key):
+                above_key = other_key
+                above_widget = self.component_widgets[other_name]
+        if above_widget is None:
             widget.raise_()
-            # Positionner au-dessus des images mais en dessous des dialogues
-            widget.stackUnder(self.component_widgets.get('text_dialog') or
-                             self.component_widgets.get('choice_dialog') or widget)
         else:
-            widget.raise_()  # Mettre au premier plan
+            widget.stackUnder(above_widget)
 
         widget.show()
 
-    def _position_widget(self, name: str, widget: QWidget):
-        """Positionne un widget selon son type."""
-        window_width = self.central_widget.width()
-        window_height = self.central_widget.height()
-
-        if name == 'text_dialog':
-            # Texte fixé en bas, toute la largeur, hauteur adaptative
-            dialog_height = min(400, int(window_height * 0.45))  # 45% de la hauteur ou 400px max
-            widget.setGeometry(0, window_height - dialog_height, window_width, dialog_height)
-        elif name == 'choice_dialog':
-            # Choix centrés
-            widget.setGeometry(0, 0, window_width, window_height)
-        elif name.startswith('image_layer_'):
+    def _z_key(self, name: str, z_order: int) -> Tuple[int, int]:
+        """
+        Clé de superposition d'un composant (plus grande = au premier plan).
+
+        Args:
+            name: Nom du composant
+            z_order: Ordre fourni pour les layers d'image
+
+        Returns:
+            (niveau, rang): les layers d'image sont triés entre eux par z_order
+        """
+        if name.startswith('image_layer_'):
+            return self.Z_IMAGES, z_order
+        return self._Z_LEVELS.get(name, self.Z_TOP), 0
+
+    def _position_widget(self, name: str, widget: QWidget, size: Optional[QSize] = None):
+        """
+        Positionne un widget selon son type.
+
+        Args:
+            name: Nom du composant
+            widget: Widget à positionner
+            size: Taille de la zone centrale si déjà connue (repositionnement de tous les widgets)
+        """
+        positioner = self._POSITIONERS.get(name)
+        if positioner is None:
+            if not name.startswith('image_layer_'):
+                return
             # Images (layers) en plein écran
-            widget.setGeometry(0, 0, window_width, window_height)
-        elif name == 'character_portrait':
-            # Portrait du personnage sur le côté droit, partiellement au-dessus de la boîte de dialogue
-            portrait_width = 400  # Largeur augmentée pour éviter de couper les personnages
-            portrait_height = 350
-            portrait_x = window_width - portrait_width - 20  # Marge à droite
-            # Position fixe en bas, légèrement au-dessus de la boîte
-            portrait_y = window_height - portrait_height - 50  # 50px du bas de la fenêtre
-            widget.setGeometry(portrait_x, portrait_y, portrait_width, portrait_height)
-        elif name == 'game_menu' or name == 'pause_menu':
-            # Menus en plein écran
-            widget.setGeometry(0, 0, window_width, window_height)
+            positioner = _full_window
+        if size is None:
+            size = self.central_widget.size()
+        widget.setGeometry(*positioner(size.width(), size.height()))
+
+    def _apply_positions(self):
+        """Repositionne tous les widgets de composants."""
+        # Taille lue une fois pour tous les widgets
+        size = self.central_widget.size()
+        for name, widget in self.component_widgets.items():
+            self._position_widget(name, widget, size)
 
     def resizeEvent(self, event):
-        """Repositionne les widgets quand la fenêtre est redimensionnée."""
+        """Programme le repositionnement des widgets (regroupé pendant un redimensionnement)."""
         super().resizeEvent(event)
-        for name, widget in self.component_widgets.items():
-            self._position_widget(name, widget)
+        self._resize_timer.start()
 
     def remove_component_widget(self, name: str):
         """Retire un widget de composant de la fenêtre."""
@@ -203,20 +331,27 @@ class GameWindow(QMainWindow):
             widget.hide()
             widget.deleteLater()
             del self.component_widgets[name]
+            del self._z_keys[name]
 
-    def clear_all_components(self):
-        """Retire tous les widgets de composants."""
-        for name in list(self.component_widgets.keys()):
-            self.remove_component_widget(name)
+    def detach_component_widget(self, name: str):
+        """
+        Retire un widget de composant de la fenêtre sans le détruire.
 
-    def keyPressEvent(self, event):
-        """Gère les événements clavier et les transmet au KeyHandler."""
-        if self.key_handler:
-            handled = self.key_handler.handle_key_press(event.key())
-            if handled:
-                event.accept()
-                return
-        super().keyPressEvent(event)
+        Le widget reste caché, prêt à être réaffiché par add_component_widget.
+        """
+        widget = self.component_widgets.pop(name, None)
+        if widget is not None:
+            del self._z_keys[name]
+            widget.hide()
+
+    def clear_all_components(self):
+        """Retire tous les widgets de composants (un seul repaint à la fin)."""
+        self.central_widget.setUpdatesEnabled(False)
+        try:
+            for name in list(self.component_widgets.keys()):
+                self.remove_component_widget(name)
+        finally:
+            self.central_widget.setUpdatesEnabled(True)
 
 
 class GUI:
@@ -231,7 +366,10 @@ class GUI:
     def __init__(self, key_handler=None, scroll_callback=None, engine=None):
         self._components: Dict[str, GUIComponent] = {}
         self._component_registry: Dict[str, Type[GUIComponent]] = {}
-        self._active_components: List[str] = []
+        # Composants actifs dans l'ordre d'affichage (dict: appartenance et retrait en O(1))
+        self._active_components: Dict[str, None] = {}
+        # Attentes de composants à interrompre lors d'un retour en arrière
+        self._interruptible_loops: List[QEventLoop] = []
         self.initialized = False
         self.key_handler = key_handler
         self.scroll_callback = scroll_callback
@@ -253,24 +391,19 @@ class GUI:
             return
 
         # Créer l'application Qt si elle n'existe pas
-        if QApplication.instance() is None:
-            self.app = QApplication(sys.argv)
-        else:
-            self.app = QApplication.instance()
+        app = QApplication.instance()
+        self.app = app if app is not None else QApplication(sys.argv)
 
         # Créer la fenêtre avec le KeyHandler
-        self.window = GameWindow(key_handler=self.key_handler)
+        self.window = GameWindow(key_handler=self.key_handler, scroll_callback=self.scroll_callback)
         self.window.show()
 
-        # Installer le filtre d'événements sur l'application entière
-        # pour capturer TOUTES les touches et le scroll, même quand un widget enfant a le focus
-        if self.key_handler or self.scroll_callback:
-            self.global_event_filter = KeyEventFilter(self.key_handler, self.scroll_callback)
-            self.app.installEventFilter(self.global_event_filter)
-            print("✓ Filtre d'événements global installé sur l'application")
+        # Raccourcis clavier résolus par Qt (QShortcut), sans filtre d'événements Python
+        if self.key_handler:
+            self.key_handler.attach(self.window)
 
         self.initialized = True
-        print("✓ GUI PyQt6 initialisé")
+        log.info("GUI PyQt6 initialisé")
 
         # Process events pour afficher la fenêtre
         self.process_events()
@@ -288,6 +421,14 @@ class GUI:
         for component_name in list(self._active_components):
             self.hide_component(component_name)
 
+        # Retirer les raccourcis clavier avant de fermer la fenêtre
+        if self.key_handler:
+            self.key_handler.detach()
+
+        # Attendre les décodages et mises à l'échelle en cours: leurs signaux
+        # ne doivent pas viser des widgets en cours de destruction
+        QThreadPool.globalInstance().waitForDone()
+
         # Fermer la fenêtre
         if self.window:
             self.window.close()
@@ -295,7 +436,23 @@ class GUI:
 
         self._components.clear()
         self.initialized = False
-        print("✓ GUI nettoyé")
+        log.info("GUI nettoyé")
+
+    def reload_assets(self) -> None:
+        """
+        Oublie les assets mis en cache pour relire les fichiers modifiés sur disque.
+
+        Les images déjà affichées restent à l'écran jusqu'à leur prochain affichage.
+        """
+        from .components.pixmap_cache import clear_cache
+        from .components.music import clear_url_cache
+        clear_cache()
+        clear_url_cache()
+
+    def interrupt_waits(self) -> None:
+        """Termine les attentes interruptibles des composants (retour en arrière ou au menu)."""
+        for loop in list(self._interruptible_loops):
+            loop.quit()
 
     def process_events(self):
         """Process Qt events pour garder l'interface réactive."""
@@ -387,14 +544,39 @@ class GUI:
         result = component.show(**kwargs)
 
         name = instance_name or component_type
-        if name not in self._active_components:
-            self._active_components.append(name)
-
-        # Process events après affichage
-        self.process_events()
+        self._active_components.setdefault(name, None)
 
+        # Pas de processEvents ici: le rendu est fait par la prochaine attente
+        # d'interaction (texte, choix, menu), qui sert la boucle d'événements
         return result
 
+    def is_component_showing(self, name: str, **kwargs) -> bool:
+        """
+        Indique si un composant affiche déjà ces paramètres.
+
+        Lit l'état réel du composant (toujours à jour après hide, retour arrière ou chargement).
+
+        Args:
+            name: Nom du composant
+            **kwargs: Mêmes paramètres que show_component
+
+        Returns:
+            True si le composant existe et affiche déjà ces paramètres
+        """
+        component = self._components.get(name)
+        return component is not None and component.is_showing(**kwargs)
+
+    def prefetch_component(self, component_type: str, paths: List[str]) -> None:
+        """
+        Prépare en arrière-plan les assets qu'un composant affichera bientôt.
+
+        Args:
+            component_type: Type du composant
+            paths: Chemins des assets
+        """
+        if paths:
+            self.get_or_create_component(component_type).prefetch(paths)
+
     def hide_component(self, name: str) -> None:
         """
         Cache un composant.
@@ -405,10 +587,7 @@ class GUI:
         component = self.get_component(name)
         if component:
             component.hide()
-            if name in self._active_components:
-                self._active_components.remove(name)
-
-        self.process_events()
+            self._active_components.pop(name, None)
 
     def update_component(self, name: str, **kwargs) -> None:
         """
@@ -419,14 +598,21 @@ class GUI:
             **kwargs: Paramètres de mise à jour
         """
         component = self.get_component(name)
-        if component:
+        # Déjà affiché avec ces paramètres: rien à repeindre
+        if component and not component.is_showing(**kwargs):
             component.update(**kwargs)
-            self.process_events()
 
     def hide_all_components(self) -> None:
-        """Cache tous les composants actifs."""
-        for name in list(self._active_components):
-            self.hide_component(name)
+        """Cache tous les composants actifs (un seul repaint à la fin)."""
+        central = self.window.central_widget if self.window else None
+        if central is not None:
+            central.setUpdatesEnabled(False)
+        try:
+            for name in list(self._active_components):
+                self.hide_component(name)
+        finally:
+            if central is not None:
+                central.setUpdatesEnabled(True)
 
     # ==================== Helpers ====================
 